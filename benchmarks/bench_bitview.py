@@ -0,0 +1,46 @@
+"""Microbenchmarks for the `bitview` operations on the field decoding path.
+
+Run with `python benchmarks/bench_bitview.py`. Prints the best time per call over a few repeats.
+"""
+
+import timeit
+
+from bitparse import bitview
+from bitparse.bit_model import BitModel
+from bitparse.fields import u8, u12, u16, u32, b1
+
+
+class Fixed(BitModel):
+    a: u8
+    b: u16
+    c: u32
+    d: u12
+    flag: b1
+
+
+VIEW = bitview(bytes(range(64)))
+SUB = VIEW[3:500:3]
+FIXED = Fixed(a=1, b=2, c=3, d=4, flag=True).to_bytes()
+
+CASES = {
+    "index": lambda: VIEW[17],
+    "negative index": lambda: VIEW[-17],
+    "slice": lambda: VIEW[8:24],
+    "open slice": lambda: VIEW[24:],
+    "strided slice": lambda: VIEW[1::2],
+    "nested slice": lambda: SUB[2:40],
+    "to_int": lambda: VIEW[5:21].to_int(),
+    # Field by field decoding, which slices the buffer twice per field.
+    "Fixed._read": lambda: Fixed._read(bitview(FIXED)),
+}
+
+
+def main(number: int = 100_000, repeat: int = 5):
+    width = max(map(len, CASES))
+    for name, case in CASES.items():
+        best = min(timeit.repeat(case, number=number, repeat=repeat)) / number
+        print(f"{name:<{width}}  {best * 1e9:8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
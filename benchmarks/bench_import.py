@@ -0,0 +1,33 @@
+"""Import time of `bitparse`, measured in fresh interpreters.
+
+Run with `python benchmarks/bench_import.py`. Prints the median wall time of `import bitparse` and
+the self time of `bitparse.fields` reported by `python -X importtime`.
+"""
+
+import statistics
+import subprocess
+import sys
+
+
+def import_times() -> tuple[float, int]:
+    """Seconds taken by `import bitparse` in a new interpreter and microseconds spent in `fields`."""
+    code = "import time; t = time.perf_counter(); import bitparse; print(time.perf_counter() - t)"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    fields = next(
+        line
+        for line in proc.stderr.splitlines()
+        if line.split("|")[-1].strip() == "bitparse.fields"
+    )
+    return float(proc.stdout.splitlines()[-1]), int(fields.split("|")[0].split(":")[1])
+
+
+def main(runs: int = 15):
+    totals, fields = zip(*(import_times() for _ in range(runs)))
+    print(f"import bitparse  {statistics.median(totals) * 1e3:8.2f} ms")
+    print(f"bitparse.fields  {statistics.median(fields) / 1e3:8.2f} ms (self)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from .bit_model import BitModel
 from .bitview import bitview
+from .tagged_union import TaggedUnion
 
-__all__ = ["BitModel", "bitview", "fields"]
+__all__ = ["BitModel", "bitview", "fields", "TaggedUnion"]
@@ -1,86 +1,991 @@
 import ast
 import copy
+import dataclasses
+import functools
+import itertools
+import math
+import mmap
+import os
+import struct
 import typing
-from collections.abc import Buffer
-from typing import dataclass_transform, Self
+from collections.abc import AsyncIterator, Buffer, Iterator
+from typing import ClassVar, dataclass_transform, Self, TYPE_CHECKING
 
 from bitarray import bitarray
+import bitarray.util as util
 
-from .bitview import bitview
-from .fields import Field
+from .bitview import BitOrder, bitview, ceildiv
+from .model_view import ModelView
+from .parallel import decode_file_parallel
+from .record_file import RecordFile
+from .stream import StreamDecoder, iter_records, read_record, write_record
+from .fields import (
+    Array,
+    Bool,
+    ByteOrder,
+    Field,
+    Float,
+    Int,
+    Nested,
+    UInt,
+    VarArray,
+    out_of_range,
+    struct_code,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+
+    import numpy as np
+
+    from .record_index import IndexedRecordFile
+
+# Buffers whose length and slices are counted in bytes. Memoryviews count items, which may be
+# wider than a byte, and go through `byte_view` first. Anything else, bitviews and bitarrays
+# included, is read through a `bitview`.
+BYTESLIKE = frozenset({bytes, bytearray, mmap.mmap})
 
 
 @dataclass_transform()
 class BitMeta(type):
-    def __new__(meta, name, bases, dct):
+    def __new__(
+        meta, name, bases, dct, byteorder: ByteOrder | None = None, bitorder: BitOrder = "msb"
+    ):
         cls = super().__new__(meta, name, bases, dct)
-        print(dct)
         if not bases:
             return cls
 
         cls.fields = {}
-        args = [ast.arg(arg="self")]
-        body = []
-        namespace = {}
+        cls.bitorder = bitorder
+        py_types = {}
         for name, annotation in dct["__annotations__"].items():
-            py_type, field = typing.get_args(annotation.__value__)
-            field = copy.copy(field)
-            if name.startswith("_"):
-                field.placeholder = True
-            type_name = f"__T_for_{name}"
-            namespace[type_name] = py_type
-            if not field.placeholder:
-                args.append(ast.arg(arg=name, annotation=ast.Name(id=type_name, ctx=ast.Load())))
-                body.append(
-                    ast.Assign(
-                        targets=[ast.Attribute(ast.Name("self", ast.Load()), name, ast.Store())],
-                        value=ast.Name(name, ast.Load()),
-                    )
+            if isinstance(annotation, BitMeta):
+                py_type, field = annotation, Nested(annotation)
+            else:
+                py_type, field = typing.get_args(getattr(annotation, "__value__", annotation))
+            # Fields are never mutated once built, so the alias's instance is shared, not copied.
+            if name.startswith("_") and not field.placeholder:
+                if dataclasses.is_dataclass(field):
+                    field = dataclasses.replace(field, placeholder=True)
+                else:
+                    field = copy.copy(field)
+                    field.placeholder = True
+            if byteorder is not None:
+                field = with_byteorder(field, byteorder)
+            if bitorder == "lsb":
+                check_lsb_field(name, field)
+            check_nested_bitorder(name, field, bitorder)
+            if isinstance(field, VarArray) and field.count not in cls.fields:
+                raise TypeError(
+                    f"count field {field.count!r} of {name!r} must be declared before it"
                 )
+            if isinstance(field, VarArray) and field.placeholder and field.item.bits is None:
+                raise TypeError(f"placeholder {name!r} needs fixed-width items to encode as zeros")
+            py_types[name] = py_type
             cls.fields[name] = field
-        mod = ast.Module(
-            [
-                ast.FunctionDef(
-                    name="__init__",
-                    args=ast.arguments(
-                        posonlyargs=[], args=args, kwonlyargs=[], kw_defaults=[], defaults=[]
-                    ),
-                    body=body,
-                    decorator_list=[],
-                    type_params=[],
-                )
-            ],
-            type_ignores=[],
-        )
-        ast.fix_missing_locations(mod)
-        code = compile(mod, filename="<dynamic>", mode="exec")
-        exec(code, namespace)
-        setattr(cls, "__init__", namespace["__init__"])
+
+        key = layout_key(cls.fields, py_types, bitorder)
+        if key is None:
+            codec = compile_codec(cls.fields, py_types, bitorder)
+        else:
+            try:
+                codec = CODEC_CACHE[key]
+            except KeyError:
+                codec = CODEC_CACHE[key] = compile_codec(cls.fields, py_types, bitorder)
+        for attr, val in codec.items():
+            setattr(cls, attr, val)
+
+        cls.bit_size = bit_size = fixed_bit_size(cls.fields)
+        if bit_size is not None:
+            cls.byte_size = ceildiv(bit_size, 8)
+            offsets = itertools.accumulate((f.bits for f in cls.fields.values()), initial=0)
+            cls.offsets = dict(zip(cls.fields, offsets))
+            for name, field in cls.fields.items():
+                if isinstance(field, Nested) and not field.placeholder:
+                    setattr(cls, name, LazyModel(name, field.model))
+        else:
+            cls.byte_size = cls.offsets = None
         return cls
 
 
 class BitModel(metaclass=BitMeta):
     fields: dict[str, Field] = {}
+    # Layout of fixed-width models, known once the class is created: the record size and the bit
+    # offset of every field from the start of the record. All None for variable-width models.
+    bit_size: ClassVar[int | None] = None
+    byte_size: ClassVar[int | None] = None
+    offsets: ClassVar[dict[str, int] | None] = None
+    # Whether bytes are numbered most or least significant bit first, see `bitview`.
+    bitorder: ClassVar[BitOrder] = "msb"
+    _struct: ClassVar[struct.Struct | None] = None
 
     @classmethod
     def from_bytes(cls, buffer: Buffer) -> Self:
-        buffer = bitview(buffer)
-        init_kwargs = {}
+        return cls._read(model_bits(buffer, cls.bitorder))[0]
+
+    @classmethod
+    def iter_from_bytes(cls, buffer: Buffer) -> Iterator[Self]:
+        """Decode back-to-back records from `buffer`, ignoring any trailing partial record."""
+        buffer = model_bits(buffer, cls.bitorder)
+        while len(buffer):
+            # Measuring only decodes the counts, and a record that doesn't fit ends the batch.
+            try:
+                if cls._measure(buffer) > len(buffer):
+                    return
+            except ValueError:
+                return
+            record, buffer = cls._read(buffer)
+            yield record
+
+    @classmethod
+    def from_bytes_many(cls, buffer: Buffer) -> list[Self]:
+        return list(cls.iter_from_bytes(buffer))
+
+    @classmethod
+    def view(cls, buffer: Buffer) -> ModelView:
+        """Wrap the record at the start of `buffer` without decoding it.
+
+        Fields are decoded individually the first time they are read. Useful when only a few
+        fields of a wide record are ever looked at. If `buffer` is writable, assigning to a field of
+        the view patches the encoded value into `buffer` in place.
+        """
+        if cls.bit_size is None:
+            raise TypeError(f"{cls.__name__} does not have a fixed-width layout")
+        buffer = bitview(buffer, cls.bitorder)
+        if len(buffer) < cls.bit_size:
+            raise ValueError(f"expected at least {cls.bit_size} bits, got {len(buffer)}")
+        return ModelView(cls, buffer[: cls.bit_size])
+
+    @classmethod
+    def decoder(cls, padded: bool = False) -> StreamDecoder[Self]:
+        """Incremental decoder that accepts chunks which don't line up with record boundaries.
+
+        Records are expected back to back at the bit level, or each padded to `byte_size` bytes
+        with `padded=True`.
+        """
+        return StreamDecoder(cls, padded)
+
+    @classmethod
+    async def read_from(cls, reader: "asyncio.StreamReader") -> Self:
+        """Read one record, as written by `write_to`, with a single `readexactly` call."""
+        return await read_record(cls, reader)
+
+    @classmethod
+    async def stream(
+        cls, reader: "asyncio.StreamReader", chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[Self]:
+        """Yield records, as written by `write_to`, until EOF, reading them in batches."""
+        async for record in iter_records(cls, reader, chunk_size):
+            yield record
+
+    @classmethod
+    def open_file(cls, path: str | os.PathLike, writable: bool = False) -> RecordFile[Self]:
+        """Memory-map a file of back-to-back records for random access by record index."""
+        return RecordFile(cls, path, writable)
+
+    @classmethod
+    def open_indexed(
+        cls, path: str | os.PathLike, index_path: str | os.PathLike | None = None
+    ) -> "IndexedRecordFile[Self]":
+        """Memory-map a file of back-to-back variable-width records for access by record index.
+
+        Record offsets are found in one pass and kept in a sidecar index file, `path + ".idx"` by
+        default, that later opens reuse or extend instead of rescanning the whole file.
+        """
+        from .record_index import IndexedRecordFile
+
+        return IndexedRecordFile(cls, path, index_path)
+
+    @classmethod
+    def iter_file(
+        cls,
+        path: str | os.PathLike,
+        start: int = 0,
+        stop: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[Self] | Iterator[list[Self]]:
+        """Lazily decode records `start` to `stop` of a memory-mapped file.
+
+        Records are yielded one at a time, or as lists of `batch_size` records. The file is never
+        read into memory as a whole, so it may be larger than RAM.
+        """
+        yield from RecordFile(cls, path).iter(start, stop, batch_size)
+
+    @classmethod
+    def decode_file_parallel(
+        cls,
+        path: str | os.PathLike,
+        workers: int | None = None,
+        columns: bool = False,
+        shard_size: int | None = None,
+    ) -> "list[Self] | dict[str, np.ndarray]":
+        """Decode a whole file of back-to-back records on `workers` processes.
+
+        Returns the records in order, or one NumPy array per field with `columns=True`. Each worker
+        memory-maps the file itself, only record ranges cross process boundaries on the way in.
+        """
+        return decode_file_parallel(cls, path, workers, columns, shard_size)
+
+    @classmethod
+    def decode_columns(cls, buffer: Buffer) -> "dict[str, np.ndarray]":
+        """Decode back-to-back records into one NumPy array per field. Requires numpy."""
+        from .columns import decode_columns
+
+        return decode_columns(cls, buffer)
+
+    @classmethod
+    def encode_columns(cls, **columns: "np.ndarray") -> bytes:
+        """Pack equal-length per-field arrays into back-to-back records. Requires numpy."""
+        from .columns import encode_columns
+
+        return encode_columns(cls, columns)
+
+    @classmethod
+    def _read(cls, buffer: bitview) -> tuple[Self, bitview]:
+        buffer = model_bits(buffer, cls.bitorder)
+        values = {}
+        for name, field in cls.fields.items():
+            if isinstance(field, VarArray):
+                values[name], buffer = field.read(buffer, values[field.count])
+            else:
+                check_length(buffer, field.bits)
+                values[name], buffer = field.from_bytes(buffer)
+        init_kwargs = {
+            name: val for name, val in values.items() if not cls.fields[name].placeholder
+        }
+        return cls(**init_kwargs), buffer
+
+    @classmethod
+    def _measure(cls, buffer: bitview) -> int:
+        """Width in bits of the record at the start of `buffer`, only decoding `VarArray` counts."""
+        if cls.bit_size is not None:
+            return cls.bit_size
+        buffer = model_bits(buffer, cls.bitorder)
+        counts = {field.count for field in cls.fields.values() if isinstance(field, VarArray)}
+        values = {}
+        pos = 0
         for name, field in cls.fields.items():
-            val, buffer = field.from_bytes(buffer)
-            if not field.placeholder:
-                init_kwargs[name] = val
-        return cls(**init_kwargs)
+            if name in counts:
+                check_length(buffer[pos:], field.bits)
+                values[name] = field.from_bytes(buffer[pos:])[0]
+            if isinstance(field, VarArray):
+                pos += field.measure(buffer[pos:], values[field.count])
+            elif field.bits is None:
+                pos += field.measure(buffer[pos:])
+            else:
+                pos += field.bits
+        return pos
 
     def to_bytes(self) -> bytes:
-        arr = bitarray()
+        return self._to_bits().tobytes()
+
+    @classmethod
+    def _from_int(cls, raw: int) -> Self:
+        raise TypeError(f"{cls.__name__} does not have a fixed-width layout")
+
+    def _to_int(self) -> int:
+        raise TypeError(f"{type(self).__name__} does not have a fixed-width layout")
+
+    def _to_bits(self) -> bitarray:
+        arr = bitarray(endian="little" if self.bitorder == "lsb" else "big")
         for name, field in self.fields.items():
+            if field.placeholder and isinstance(field, VarArray):
+                # As many zero items as the count says.
+                arr.extend(util.zeros(getattr(self, field.count) * field.item.bits))
+                continue
             if field.placeholder:
                 val = 0
             else:
                 val = getattr(self, name)
-            arr.extend(field.to_bits(val))
-        return arr.tobytes()
+            if isinstance(field, VarArray) and len(val) != getattr(self, field.count):
+                raise ValueError(
+                    f"{name!r} has {len(val)} items but {field.count!r} is "
+                    f"{getattr(self, field.count)}"
+                )
+            bits = field.to_bits(val)
+            if self.bitorder == "lsb":
+                # Fields hand out their bits most significant first.
+                bits.reverse()
+            arr.extend(bits)
+        return arr
 
     def __bytes__(self) -> bytes:
         return self.to_bytes()
+
+    async def write_to(self, writer: "asyncio.StreamWriter"):
+        """Write `to_bytes()` to `writer`, waiting for it to drain to respect flow control."""
+        await write_record(self, writer)
+
+
+# Generated methods of every layout seen so far, keyed by `layout_key`. Classes generated at runtime
+# from the same schema only pay for code generation once.
+CODEC_CACHE: dict[tuple, dict[str, typing.Any]] = {}
+
+
+def layout_key(
+    fields: dict[str, Field], py_types: dict[str, type], bitorder: BitOrder
+) -> tuple | None:
+    """Hashable signature of a layout: everything the generated code depends on.
+
+    None when a field can't be keyed, not being a dataclass or holding unhashable values, and the
+    layout isn't cached.
+    """
+    try:
+        key = (
+            bitorder,
+            tuple((name, py_types[name], field_key(field)) for name, field in fields.items()),
+        )
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def field_key(field: Field) -> tuple:
+    if not is_field(field):
+        raise TypeError(f"{type(field).__name__} fields can't be keyed")
+    values = [getattr(field, name) for name in field.__dataclass_fields__]
+    # Array and VarArray items are fields themselves, nested models are keyed by identity.
+    return type(field), *(field_key(v) if is_field(v) else v for v in values)
+
+
+def is_field(val: typing.Any) -> bool:
+    return hasattr(type(val), "__dataclass_fields__")
+
+
+# Methods `compile_codec` generates for fixed-width layouts, over the generic ones of `BitModel`.
+GENERATED_METHODS = ("from_bytes", "to_bytes", "iter_from_bytes", "_from_int", "_to_int")
+
+
+def compile_codec(
+    fields: dict[str, Field], py_types: dict[str, type], bitorder: BitOrder
+) -> dict[str, typing.Any]:
+    """Generate `__init__` and, for fixed-width layouts, the codec methods of a model class.
+
+    Variable-width layouts get the generic methods of `BitModel` back, so that a subclass doesn't
+    keep the ones compiled for the layout of a fixed-width parent.
+    """
+    codec = {"__init__": compile_init(fields, py_types), "_struct": None}
+    bit_size = fixed_bit_size(fields)
+    if bit_size is None:
+        codec.update((attr, BitModel.__dict__[attr]) for attr in GENERATED_METHODS)
+        return codec
+    lsb = bitorder == "lsb"
+    from_bytes = compile_decoder(fields, bit_size, lsb)
+    to_bytes = compile_encoder(fields, bit_size, lsb)
+    iter_from_bytes = compile_batch_decoder(fields, bit_size, lsb)
+    if (fmt := struct_format(fields, lsb)) is not None:
+        codec["_struct"] = packer = struct.Struct(fmt)
+        from_bytes = compile_struct_decoder(fields, packer, from_bytes)
+        to_bytes = compile_struct_encoder(fields, packer, to_bytes)
+        iter_from_bytes = compile_struct_batch_decoder(fields, packer, bitorder)
+    codec["from_bytes"] = classmethod(from_bytes)
+    codec["to_bytes"] = to_bytes
+    codec["iter_from_bytes"] = classmethod(iter_from_bytes)
+    codec["_from_int"] = classmethod(compile_int_decoder(fields, bit_size, lsb))
+    codec["_to_int"] = compile_int_encoder(fields, bit_size, lsb)
+    return codec
+
+
+def compile_init(fields: dict[str, Field], py_types: dict[str, type]):
+    """Generate an `__init__` taking every non-placeholder field, annotated with its Python type."""
+    args = [ast.arg(arg="self")]
+    body = []
+    namespace = {}
+    for name, field in fields.items():
+        if field.placeholder:
+            continue
+        type_name = f"__T_for_{name}"
+        namespace[type_name] = py_types[name]
+        args.append(ast.arg(arg=name, annotation=_load(type_name)))
+        body.append(
+            ast.Assign(targets=[ast.Attribute(_load("self"), name, ast.Store())], value=_load(name))
+        )
+    mod = ast.Module(
+        [
+            ast.FunctionDef(
+                name="__init__",
+                args=ast.arguments(
+                    posonlyargs=[], args=args, kwonlyargs=[], kw_defaults=[], defaults=[]
+                ),
+                body=body or [ast.Pass()],
+                decorator_list=[],
+                type_params=[],
+            )
+        ],
+        type_ignores=[],
+    )
+    return _compile_module(mod, "__init__", namespace)
+
+
+def with_byteorder(field: Field, byteorder: ByteOrder) -> Field:
+    """`field` with `byteorder` filled in wherever it doesn't choose one itself."""
+    match field:
+        case Array() | VarArray():
+            return dataclasses.replace(field, item=with_byteorder(field.item, byteorder))
+        case UInt() | Int() | Float() if field.byteorder is None and field.bits % 8 == 0:
+            return dataclasses.replace(field, byteorder=byteorder)
+        case _:
+            return field
+
+
+class LazyModel:
+    """Attribute for a nested model field of a fixed-width model, built on first access.
+
+    Compiled decoders only store the nested record's raw bits, as `_<name>_bits`, and this
+    non-data descriptor turns them into a model instance the first time the field is read. The
+    instance then lands in the instance `__dict__`, which shadows the descriptor from then on, as
+    does a value assigned to the field. Encoders only reuse the raw bits while neither happened.
+    """
+
+    def __init__(self, name: str, model: type[BitModel]):
+        self.name = name
+        self.bits_name = f"_{name}_bits"
+        self.model = model
+
+    def __get__(self, obj: BitModel | None, objtype: type | None = None):
+        if obj is None:
+            return self
+        try:
+            raw = obj.__dict__.pop(self.bits_name)
+        except KeyError:
+            raise AttributeError(f"{type(obj).__name__!r} object has no attribute {self.name!r}")
+        val = obj.__dict__[self.name] = self.model._from_int(raw)
+        return val
+
+
+def fixed_bit_size(fields: dict[str, Field]) -> int | None:
+    """Total width of a record, or None if some field cannot be decoded from a plain int."""
+    total = 0
+    for field in fields.values():
+        bits = getattr(field, "bits", None)
+        if not isinstance(bits, int) or not hasattr(field, "from_int"):
+            return None
+        total += bits
+    return total if total > 0 else None
+
+
+def compile_decoder(fields: dict[str, Field], bit_size: int, lsb: bool = False):
+    """Generate a `from_bytes` that reads the whole record with a single `int.from_bytes`.
+
+    Every field sits at a shift that is known once the class is created, so the generated body is
+    a straight run of shift/mask expressions instead of a loop over `Field.from_bytes`.
+
+    LSB-first records are read little-endian, which puts the first field in the lowest bits.
+    """
+    nbytes = ceildiv(bit_size, 8)
+    namespace = {
+        "_new": object.__new__,
+        "_byteslike": BYTESLIKE,
+        "_byte_view": byte_view,
+        "_view_int": view_int,
+    }
+    if lsb:
+        read = f"int.from_bytes(buffer[:{nbytes}], 'little') & {(1 << bit_size) - 1}"
+    else:
+        read = f"int.from_bytes(buffer[:{nbytes}]) >> {nbytes * 8 - bit_size}"
+    read_bytes = (
+        f"    if len(buffer) < {nbytes}:\n"
+        f"        raise ValueError(f'expected at least {nbytes} bytes, got {{len(buffer)}}')\n"
+        f"    v = {read}\n"
+    )
+    prologue = ast.parse(
+        f"if type(buffer) in _byteslike:\n"
+        f"{read_bytes}"
+        f"elif type(buffer) is memoryview:\n"
+        f"    buffer = _byte_view(buffer)\n"
+        f"{read_bytes}"
+        f"else:\n"
+        f"    v = _view_int(buffer, {bit_size}, {'lsb' if lsb else 'msb'!r})\n"
+    ).body
+    body = record_body(fields, bit_size, namespace, lsb)
+    body.append(ast.Return(_load("self")))
+    return _compile_function("from_bytes", ["cls", "buffer"], prologue + body, namespace)
+
+
+def compile_int_decoder(fields: dict[str, Field], bit_size: int, lsb: bool = False):
+    """Generate `_from_int`, building a record from its bits held in an unsigned int.
+
+    Used to decode nested models lazily from the bits their parent extracted.
+    """
+    namespace = {"_new": object.__new__}
+    body = record_body(fields, bit_size, namespace, lsb)
+    body.append(ast.Return(_load("self")))
+    return _compile_function("_from_int", ["cls", "v"], body, namespace)
+
+
+def compile_batch_decoder(fields: dict[str, Field], bit_size: int, lsb: bool = False):
+    """Generate an `iter_from_bytes` for back-to-back records of `bit_size` bits.
+
+    Records realign to a byte boundary every `lcm(bit_size, 8)` bits, so the buffer is consumed
+    one such group at a time with a single `int.from_bytes`, and each record in the group is
+    split off with a constant shift before running the same inlined body as `from_bytes`.
+    """
+    group_bits = math.lcm(bit_size, 8)
+    per_group, group_bytes = group_bits // bit_size, group_bits // 8
+    namespace = {"_new": object.__new__, "_as_bytes": as_bytes}
+    mask = ast.Constant((1 << bit_size) - 1)
+    records = []
+    for i in range(per_group):
+        shift = i * bit_size if lsb else group_bits - (i + 1) * bit_size
+        record = _load("g")
+        if shift:
+            record = ast.BinOp(record, ast.RShift(), ast.Constant(shift))
+        if shift + bit_size < group_bits:
+            record = ast.BinOp(record, ast.BitAnd(), mask)
+        records.append(record)
+    body = record_body(fields, bit_size, namespace, lsb)
+    body.append(ast.Expr(ast.Yield(_load("self"))))
+    bitorder, byteorder = ("lsb", "little") if lsb else ("msb", "big")
+
+    mod = _template(
+        f"def iter_from_bytes(cls, buffer):\n"
+        f"    data, nbits = _as_bytes(buffer, {bitorder!r})\n"
+        f"    count = nbits // {bit_size}\n"
+        f"    stop = count // {per_group} * {group_bytes}\n"
+        f"    for off in range(0, stop, {group_bytes}):\n"
+        f"        g = int.from_bytes(data[off : off + {group_bytes}], {byteorder!r})\n"
+        f"        for v in RECORDS:\n"
+        f"            BODY\n"
+        f"    if count % {per_group}:\n"
+        f"        g = data[stop:].tobytes().ljust({group_bytes}, b'\\0')\n"
+        f"        g = int.from_bytes(g, {byteorder!r})\n"
+        f"        for v in RECORDS[: count % {per_group}]:\n"
+        f"            BODY\n",
+        RECORDS=ast.Tuple(records, ast.Load()),
+        BODY=body,
+    )
+    return _compile_module(mod, "iter_from_bytes", namespace)
+
+
+def record_body(
+    fields: dict[str, Field], bit_size: int, namespace: dict, lsb: bool = False
+) -> list[ast.stmt]:
+    """Statements that build `self` from the `bit_size`-bit record held in local `v`.
+
+    Fields follow each other from the top bits of `v` down, or from the bottom up with `lsb`.
+    """
+    body = [_assign("self", _call(_load("_new"), _load("cls")))]
+    offset = 0
+    for name, field in fields.items():
+        shift = offset if lsb else bit_size - offset - field.bits
+        offset += field.bits
+        if field.placeholder:
+            continue
+        raw = _load("v")
+        if shift:
+            raw = ast.BinOp(raw, ast.RShift(), ast.Constant(shift))
+        if shift + field.bits < bit_size:
+            raw = ast.BinOp(raw, ast.BitAnd(), ast.Constant((1 << field.bits) - 1))
+        if isinstance(field, Nested):
+            # Left for `LazyModel` to decode on first access.
+            target = ast.Attribute(_load("self"), f"_{name}_bits", ast.Store())
+            body.append(ast.Assign(targets=[target], value=raw))
+            continue
+        body.append(
+            ast.Assign(
+                targets=[ast.Attribute(_load("self"), name, ast.Store())],
+                value=decode_expr(field, raw, namespace, name),
+            )
+        )
+    return body
+
+
+def decode_expr(field: Field, raw: ast.expr, namespace: dict, name: str) -> ast.expr:
+    """Expression converting the unsigned `raw` bits of `field` into its Python value."""
+    match field:
+        case UInt(byteorder="little") | Int(byteorder="little"):
+            # The raw bits are the bytes as laid out, reread them the other way round.
+            data = _call(ast.Attribute(raw, "to_bytes", ast.Load()), ast.Constant(field.bits // 8))
+            call = _call(ast.Attribute(_load("int"), "from_bytes", ast.Load()), data)
+            call.args.append(ast.Constant("little"))
+            if isinstance(field, Int):
+                call.keywords.append(ast.keyword("signed", ast.Constant(True)))
+            return call
+        case UInt():
+            return raw
+        case Int():
+            half = ast.Constant(1 << (field.bits - 1))
+            return ast.BinOp(ast.BinOp(raw, ast.BitXor(), half), ast.Sub(), half)
+        case Bool():
+            return ast.Compare(raw, [ast.NotEq()], [ast.Constant(0)])
+        case Float():
+            # Reinterpret the bits through the field's precompiled `Struct`, without a method call.
+            namespace[f"_unpack_{name}"] = field._struct.unpack
+            data = _call(ast.Attribute(raw, "to_bytes", ast.Load()), ast.Constant(field.bits // 8))
+            return ast.Subscript(_call(_load(f"_unpack_{name}"), data), ast.Constant(0), ast.Load())
+        case _:
+            namespace[f"_from_int_{name}"] = field.from_int
+            return _call(_load(f"_from_int_{name}"), raw)
+
+
+def compile_encoder(fields: dict[str, Field], bit_size: int, lsb: bool = False):
+    """Generate a `to_bytes` that shifts every field into one int and calls `int.to_bytes` once.
+
+    Placeholders contribute constant zero bits, so they are simply left out of the sum.
+    """
+    nbytes = ceildiv(bit_size, 8)
+    namespace = {"_out_of_range": out_of_range}
+    body = []
+    value = record_value(fields, bit_size if lsb else nbytes * 8, body, namespace, lsb)
+    to_bytes = _call(ast.Attribute(value, "to_bytes", ast.Load()), ast.Constant(nbytes))
+    if lsb:
+        to_bytes.args.append(ast.Constant("little"))
+    body.append(ast.Return(to_bytes))
+    return _compile_function("to_bytes", ["self"], body, namespace)
+
+
+def compile_int_encoder(fields: dict[str, Field], bit_size: int, lsb: bool = False):
+    """Generate `_to_int`, the inverse of `_from_int`, used to encode nested models in place."""
+    namespace = {"_out_of_range": out_of_range}
+    body = []
+    body.append(ast.Return(record_value(fields, bit_size, body, namespace, lsb)))
+    return _compile_function("_to_int", ["self"], body, namespace)
+
+
+def record_value(
+    fields: dict[str, Field], width: int, body: list[ast.stmt], namespace: dict, lsb: bool = False
+) -> ast.expr:
+    """Expression for the record `self` as a `width`-bit int, appending its checks to `body`."""
+    terms = []
+    offset = 0
+    for name, field in fields.items():
+        shift = offset if lsb else width - offset - field.bits
+        offset += field.bits
+        if field.placeholder:
+            continue
+        if isinstance(field, Nested):
+            # A nested record that was never accessed or assigned is still held as raw bits, reuse
+            # them as is.
+            namespace[f"_to_int_{name}"] = field.model._to_int
+            body.extend(
+                ast.parse(
+                    f"{name} = self.__dict__.get('_{name}_bits')\n"
+                    f"if {name} is None or {name!r} in self.__dict__:\n"
+                    f"    {name} = _to_int_{name}(self.{name})\n"
+                ).body
+            )
+            raw = _load(name)
+        else:
+            body.append(_assign(name, ast.Attribute(_load("self"), name, ast.Load())))
+            raw = encode_expr(field, name, body, namespace)
+        if shift:
+            raw = ast.BinOp(raw, ast.LShift(), ast.Constant(shift))
+        terms.append(raw)
+    if not terms:
+        return ast.Constant(0)
+    return functools.reduce(lambda a, b: ast.BinOp(a, ast.BitOr(), b), terms)
+
+
+def encode_expr(field: Field, name: str, body: list[ast.stmt], namespace: dict) -> ast.expr:
+    """Expression for the unsigned bits of local `name`, appending any range check to `body`."""
+    val = _load(name)
+    match field:
+        case UInt(byteorder="little") | Int(byteorder="little"):
+            signed = isinstance(field, Int)
+            lo, hi = (
+                (-(1 << (field.bits - 1)), 1 << (field.bits - 1))
+                if signed
+                else (0, 1 << field.bits)
+            )
+            biased = ast.BinOp(val, ast.Add(), ast.Constant(-lo)) if signed else val
+            body.append(_range_check(biased, val, lo, hi, signed=signed))
+            data = _call(
+                ast.Attribute(val, "to_bytes", ast.Load()),
+                ast.Constant(field.bits // 8),
+                ast.Constant("little"),
+            )
+            if signed:
+                data.keywords.append(ast.keyword("signed", ast.Constant(True)))
+            return _call(ast.Attribute(_load("int"), "from_bytes", ast.Load()), data)
+        case UInt():
+            hi = 1 << field.bits
+            body.append(_range_check(val, val, 0, hi, signed=False))
+            return val
+        case Int():
+            half = 1 << (field.bits - 1)
+            biased = ast.BinOp(val, ast.Add(), ast.Constant(half))
+            body.append(_range_check(biased, val, -half, half, signed=True))
+            return ast.BinOp(val, ast.BitAnd(), ast.Constant((1 << field.bits) - 1))
+        case Bool():
+            return ast.IfExp(val, ast.Constant(1), ast.Constant(0))
+        case Float():
+            namespace[f"_pack_{name}"] = field._struct.pack
+            return _call(
+                ast.Attribute(_load("int"), "from_bytes", ast.Load()),
+                _call(_load(f"_pack_{name}"), val),
+            )
+        case _:
+            namespace[f"_to_int_{name}"] = field.to_int
+            return _call(_load(f"_to_int_{name}"), val)
+
+
+def _range_check(biased: ast.expr, val: ast.expr, lo: int, hi: int, signed: bool) -> ast.If:
+    # `biased` is in range(0, hi - lo) exactly when no bit at or above the field width is set.
+    error = _call(
+        _load("_out_of_range"), val, ast.Constant(lo), ast.Constant(hi), ast.Constant(signed)
+    )
+    return ast.If(ast.BinOp(biased, ast.BitAnd(), ast.Constant(-(hi - lo))), [ast.Raise(error)], [])
+
+
+def struct_format(fields: dict[str, Field], lsb: bool = False) -> str | None:
+    """`struct` format for layouts made only of byte-sized ints and floats, else None.
+
+    `struct` takes a single byte order for the whole format, so mixed-endian layouts get None too.
+    Whole-byte fields of LSB-first layouts read the same as little-endian ones.
+    """
+    orders = {
+        field.byteorder or "big"
+        for field in fields.values()
+        if not field.placeholder and field.bits > 8 and hasattr(field, "byteorder")
+    }
+    if lsb:
+        orders = {"little"}
+    if len(orders) > 1:
+        return None
+    codes = ["<" if orders == {"little"} else ">"]
+    for field in fields.values():
+        match field:
+            case _ if field.placeholder and field.bits % 8 == 0:
+                codes.append(f"{field.bits // 8}x")
+            case _ if (code := struct_code(field)) is not None:
+                codes.append(code)
+            case _:
+                return None
+    return "".join(codes)
+
+
+def compile_struct_decoder(fields: dict[str, Field], packer: struct.Struct, fallback):
+    """Generate a `from_bytes` that unpacks byte-aligned layouts with a precompiled `Struct`.
+
+    Bit containers may start mid-byte, so those are still handed to the int-based `fallback`.
+    """
+    namespace = {
+        "_new": object.__new__,
+        "_byteslike": BYTESLIKE,
+        "_byte_view": byte_view,
+        "_fallback": fallback,
+        "_unpack_from": packer.unpack_from,
+    }
+    body = ast.parse(
+        f"if type(buffer) not in _byteslike:\n"
+        f"    if type(buffer) is not memoryview:\n"
+        f"        return _fallback(cls, buffer)\n"
+        f"    buffer = _byte_view(buffer)\n"
+        f"if len(buffer) < {packer.size}:\n"
+        f"    raise ValueError(f'expected at least {packer.size} bytes, got {{len(buffer)}}')\n"
+        f"self = _new(cls)\n"
+    ).body
+    targets = [
+        ast.Attribute(_load("self"), name, ast.Store())
+        for name, field in fields.items()
+        if not field.placeholder
+    ]
+    body.append(
+        ast.Assign(
+            targets=[ast.Tuple(targets, ast.Store())],
+            value=_call(_load("_unpack_from"), _load("buffer")),
+        )
+    )
+    body.append(ast.Return(_load("self")))
+    return _compile_function("from_bytes", ["cls", "buffer"], body, namespace)
+
+
+def compile_struct_batch_decoder(
+    fields: dict[str, Field], packer: struct.Struct, bitorder: BitOrder = "msb"
+):
+    """Generate an `iter_from_bytes` that walks the buffer with `Struct.iter_unpack`."""
+    namespace = {"_new": object.__new__, "_as_bytes": as_bytes, "_iter_unpack": packer.iter_unpack}
+    targets = [
+        ast.Attribute(_load("self"), name, ast.Store())
+        for name, field in fields.items()
+        if not field.placeholder
+    ]
+    mod = _template(
+        f"def iter_from_bytes(cls, buffer):\n"
+        f"    data, nbits = _as_bytes(buffer, {bitorder!r})\n"
+        f"    stop = nbits // {packer.size * 8} * {packer.size}\n"
+        f"    for values in _iter_unpack(data[:stop]):\n"
+        f"        self = _new(cls)\n"
+        f"        TARGETS = values\n"
+        f"        yield self\n",
+        TARGETS=ast.Tuple(targets, ast.Store()),
+    )
+    return _compile_module(mod, "iter_from_bytes", namespace)
+
+
+def compile_struct_encoder(fields: dict[str, Field], packer: struct.Struct, fallback):
+    """Generate a `to_bytes` that packs byte-aligned layouts with a precompiled `Struct`.
+
+    `struct.error` is rerun through the int-based `fallback` so that out-of-range values raise the
+    same `OverflowError` as every other layout.
+    """
+    namespace = {"_fallback": fallback, "_pack": packer.pack, "_struct_error": struct.error}
+    values = [
+        ast.Attribute(_load("self"), name, ast.Load())
+        for name, field in fields.items()
+        if not field.placeholder
+    ]
+    body = [
+        ast.Try(
+            body=[ast.Return(_call(_load("_pack"), *values))],
+            handlers=[
+                ast.ExceptHandler(
+                    _load("_struct_error"),
+                    None,
+                    [ast.Return(_call(_load("_fallback"), _load("self")))],
+                )
+            ],
+            orelse=[],
+            finalbody=[],
+        )
+    ]
+    return _compile_function("to_bytes", ["self"], body, namespace)
+
+
+def as_bytes(buffer: Buffer, bitorder: BitOrder = "msb") -> tuple[memoryview, int]:
+    """Byte-level view of `buffer` and the number of bits in it that belong to the data.
+
+    Bit containers are realigned with a single copy when they don't start on a byte boundary, or
+    hold their bits in the other `bitorder`.
+    """
+    if type(buffer) in BYTESLIKE or type(buffer) is memoryview:
+        data = byte_view(memoryview(buffer))
+        return data, len(data) * 8
+    view = bitview(buffer, bitorder)
+    if view._step == 1 and view._start % 8 == 0 and view.bitorder == bitorder:
+        return memoryview(view), len(view)
+    return memoryview(_reorder(view, bitorder).tobytes()), len(view)
+
+
+def check_length(buffer: bitview, bits: int | None):
+    """Reject a `buffer` too short for a field of `bits`, None for variable-width fields."""
+    if bits is not None and len(buffer) < bits:
+        raise ValueError(f"expected at least {bits} bits, got {len(buffer)}")
+
+
+def byte_view(buffer: memoryview) -> memoryview:
+    """`buffer` as a flat view of unsigned bytes, so that its length and slices count bytes."""
+    if buffer.format == "B" and buffer.ndim == 1:
+        return buffer
+    return buffer.cast("B")
+
+
+def model_bits(buffer: Buffer, bitorder: BitOrder) -> bitview:
+    """`buffer` as a `bitview` in `bitorder`, the order the fields of a model are read in.
+
+    Bit containers in the other order keep the sequence of their bits, which are copied once into
+    `bitorder`, so the generic decoder reads the same values as `view_int` and `as_bytes`.
+    """
+    view = bitview(buffer, bitorder)
+    if view.bitorder != bitorder:
+        return bitview(_reorder(view, bitorder))
+    return view
+
+
+def view_int(buffer: bitview | bitarray, nbits: int, bitorder: BitOrder = "msb") -> int:
+    view = bitview(buffer, bitorder)
+    if len(view) < nbits:
+        raise ValueError(f"expected at least {nbits} bits, got {len(view)}")
+    if view.bitorder != bitorder:
+        return util.ba2int(_reorder(view[:nbits], bitorder))
+    return view[:nbits].to_int()
+
+
+def _reorder(view: bitview, bitorder: BitOrder) -> bitarray:
+    """Copy of the bits of `view`, in the same sequence, in a bitarray of the given `bitorder`."""
+    stop = view._start + len(view) * view._step
+    if stop < 0:
+        stop = None
+    bits = view._data[view._start : stop : view._step]
+    return bitarray(bits, endian="little" if bitorder == "lsb" else "big")
+
+
+def check_lsb_field(name: str, field: Field):
+    """Reject fields whose encoding assumes most significant bit first."""
+    match field:
+        case UInt() | Int() | Float() if field.byteorder is not None:
+            raise TypeError(f"field {name!r} sets a byteorder, LSB-first models are little-endian")
+        case UInt() | Int() | Float() | Bool():
+            pass
+        case Nested() if field.model.bitorder == "lsb":
+            pass
+        case _:
+            raise TypeError(f"field {name!r} of type {type(field).__name__} can't be LSB-first")
+
+
+def check_nested_bitorder(name: str, field: Field, bitorder: BitOrder):
+    """Reject nested models, including array items, that number bits in another order."""
+    match field:
+        case Array() | VarArray():
+            check_nested_bitorder(name, field.item, bitorder)
+        case Nested() if field.model.bitorder != bitorder:
+            raise TypeError(
+                f"field {name!r} nests {field.model.__name__}, which is "
+                f"{field.model.bitorder}-first in a {bitorder}-first model"
+            )
+
+
+def _load(name: str) -> ast.Name:
+    return ast.Name(name, ast.Load())
+
+
+def _call(func: ast.expr, *args: ast.expr) -> ast.Call:
+    return ast.Call(func, list(args), [])
+
+
+def _assign(name: str, value: ast.expr) -> ast.Assign:
+    return ast.Assign(targets=[ast.Name(name, ast.Store())], value=value)
+
+
+def _compile_function(name: str, args: list[str], body: list[ast.stmt], namespace: dict):
+    mod = ast.Module(
+        [
+            ast.FunctionDef(
+                name=name,
+                args=ast.arguments(
+                    posonlyargs=[],
+                    args=[ast.arg(arg=arg) for arg in args],
+                    kwonlyargs=[],
+                    kw_defaults=[],
+                    defaults=[],
+                ),
+                body=body,
+                decorator_list=[],
+                type_params=[],
+            )
+        ],
+        type_ignores=[],
+    )
+    return _compile_module(mod, name, namespace)
+
+
+def _compile_module(mod: ast.Module, name: str, namespace: dict):
+    ast.fix_missing_locations(mod)
+    code = compile(mod, filename="<dynamic>", mode="exec")
+    exec(code, namespace)
+    return namespace[name]
+
+
+def _template(source: str, **substitutions: ast.expr | list[ast.stmt]) -> ast.Module:
+    """Parse `source`, replacing each placeholder name with a generated node.
+
+    A placeholder standing alone as a statement is replaced by a list of statements, anywhere else
+    by an expression.
+    """
+    return _Substitute(substitutions).visit(ast.parse(source))
+
+
+class _Substitute(ast.NodeTransformer):
+    def __init__(self, substitutions: dict[str, ast.expr | list[ast.stmt]]):
+        self.substitutions = substitutions
+
+    def visit_Expr(self, node: ast.Expr):
+        if isinstance(node.value, ast.Name) and node.value.id in self.substitutions:
+            return copy.deepcopy(self.substitutions[node.value.id])
+        return self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name):
+        if node.id in self.substitutions:
+            return copy.deepcopy(self.substitutions[node.id])
+        return node
@@ -1,14 +1,28 @@
-from collections.abc import Buffer
+from collections.abc import Buffer, Iterable
 from inspect import BufferFlags
-from typing import Literal, Self
-import functools
+from typing import Literal, overload, Self
+import operator
 
 from bitarray import bitarray
 import bitarray.util as util
 
+type BitOrder = Literal["msb", "lsb"]
+
 
 class bitview(Buffer):
-    def __init__(self, buffer: Buffer):
+    # Views of mutable buffers are unhashable, like `bytearray`.
+    __hash__ = None
+    # Slots keep views small and attribute access fast. Sub-views are built by `_derive`, which
+    # fills the slots directly instead of going through `__init__`.
+    __slots__ = ("_data", "_start", "_len", "_step")
+
+    def __init__(self, buffer: Buffer, bitorder: BitOrder = "msb"):
+        """View the bits of `buffer`.
+
+        Bytes are read most significant bit first, or least significant bit first with
+        `bitorder="lsb"`, as in DEFLATE or CAN frames. A `bitarray` keeps its own order, MSB-first
+        for big-endian and LSB-first for little-endian ones, and so does a `bitview`.
+        """
         if isinstance(buffer, bitview):
             self._data = buffer._data
             self._start = buffer._start
@@ -18,32 +32,73 @@ class bitview(Buffer):
             if isinstance(buffer, bitarray):
                 self._data = buffer
             else:
-                self._data = bitarray(buffer=buffer, endian="big")
+                endian = "little" if bitorder == "lsb" else "big"
+                self._data = bitarray(buffer=buffer, endian=endian)
             self._start = 0
             self._len = len(self._data)
             self._step = 1
 
-    @functools.singledispatchmethod
-    def __getitem__(self, idx: int) -> Literal[0, 1]:
-        if idx < 0:
-            idx += len(self)
-        if not 0 <= idx < len(self):
-            raise IndexError("bitview index out of range: {idx=}")
-        idx = self._step * idx + self._start
-        return self._data[idx]
-
-    @__getitem__.register
-    def _(self, idx: slice) -> Self:
-        r = range(*idx.indices(len(self)))
-        view = type(self)(self._data)
-        view._start = self._start + r.start
-        view._len = len(r)
-        view._step = self._step * r.step
+    @property
+    def bitorder(self) -> BitOrder:
+        return "lsb" if self._data.endian == "little" else "msb"
+
+    def _derive(self, start: int, length: int, step: int) -> Self:
+        view = object.__new__(type(self))
+        view._data = self._data
+        view._start = start
+        view._len = length
+        view._step = step
         return view
 
+    @overload
+    def __getitem__(self, idx: int) -> Literal[0, 1]: ...
+    @overload
+    def __getitem__(self, idx: slice) -> Self: ...
+    def __getitem__(self, idx: int | slice) -> Literal[0, 1] | Self:
+        if type(idx) is slice:
+            start, stop, step = idx.indices(self._len)
+            if step == 1:
+                return self._derive(
+                    self._start + self._step * start, max(stop - start, 0), self._step
+                )
+            return self._derive(
+                self._start + self._step * start, len(range(start, stop, step)), self._step * step
+            )
+        return self._data[self._index(idx)]
+
+    def __setitem__(self, idx: int | slice, val: Literal[0, 1] | Iterable[Literal[0, 1]]):
+        if type(idx) is not slice:
+            self._data[self._index(idx)] = val
+            return
+        view = self[idx]
+        if not isinstance(val, bitarray):
+            val = bitarray(val)
+        if len(val) != len(view):
+            raise ValueError(f"cannot assign {len(val)} bits to a bitview of length {len(view)}")
+        stop = view._start + len(view) * view._step
+        if stop < 0:
+            stop = None
+        view._data[view._start : stop : view._step] = val
+
+    def _index(self, idx: int) -> int:
+        """Position in `_data` of bit `idx` of this view."""
+        idx = operator.index(idx)
+        if idx < 0:
+            idx += self._len
+        if not 0 <= idx < self._len:
+            raise IndexError(f"bitview index out of range: {idx=}")
+        return self._step * idx + self._start
+
     def __len__(self) -> int:
         return self._len
 
+    def copy(self) -> Self:
+        """View of a copy of these bits, detached from the underlying buffer."""
+        stop = self._start + self._len * self._step
+        if stop < 0:
+            stop = None
+        return type(self)(self._data[self._start : stop : self._step])
+
     def __buffer__(self, flag: BufferFlags) -> memoryview:
         if self._step != 1:
             raise NotImplementedError("buffer interface only supported for contiguous bitviews")
@@ -61,9 +116,41 @@ class bitview(Buffer):
     def to_bytes(self):
         return bytes(self)
 
-    def to_int(self, signed: bool = False) -> int:
-        stop = self._start + len(self) * self._step
-        return util.ba2int(self._data[self._start : stop : self._step], signed=signed)
+    def to_int(self, signed: bool = False, byteorder: Literal["big", "little"] = "big") -> int:
+        """Value of the bits of this view, most significant first, or by bytes with `"little"`."""
+        if byteorder == "little":
+            return self._to_int_little(signed)
+        length = self._len
+        if self._step != 1 or not length:
+            stop = self._start + length * self._step
+            return util.ba2int(self._data[self._start : stop : self._step], signed=signed)
+        # Contiguous bits: read the bytes covering them and shift the extra bits out. LSB-first
+        # bits are the low end of the bytes read little-endian, so they need no bit reversal.
+        start = self._start
+        stop = start + length
+        data = memoryview(self._data)[start // 8 : ceildiv(stop, 8)]
+        if self._data.endian == "big":
+            val = int.from_bytes(data) >> (-stop % 8)
+        else:
+            val = int.from_bytes(data, "little") >> (start % 8)
+        val &= (1 << length) - 1
+        if signed and val >> (length - 1):
+            val -= 1 << length
+        return val
+
+    def _to_int_little(self, signed: bool) -> int:
+        length = self._len
+        if length % 8:
+            raise ValueError(f"little-endian ints must be whole bytes, got {length} bits")
+        if self._step == 1 and self._start % 8 == 0 and self._data.endian == "big":
+            start = self._start // 8
+            data = memoryview(self._data)[start : start + length // 8]
+            return int.from_bytes(data, "little", signed=signed)
+        return int.from_bytes(self.to_int().to_bytes(length // 8), "little", signed=signed)
+
+    def set_int(self, val: int, signed: bool = False):
+        """Overwrite the bits of this view, in place, with `val`. The inverse of `to_int`."""
+        self[:] = util.int2ba(val, length=len(self), endian=self._data.endian, signed=signed)
 
 
 def ceildiv(a: int, b: int) -> int:
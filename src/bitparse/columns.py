@@ -0,0 +1,241 @@
+import math
+from collections.abc import Buffer
+
+import numpy as np
+
+from .bit_model import BitModel, as_bytes
+from .fields import Array, Bool, Field, Float, Int, UInt, out_of_range
+
+
+def decode_columns(model: type[BitModel], buffer: Buffer) -> dict[str, np.ndarray]:
+    """Decode back-to-back records of `model` into one array per non-placeholder field.
+
+    `Array` fields become two-dimensional, with one row of `count` items per record.
+
+    Records realign to a byte boundary every `lcm(bit_size, 8)` bits, so the buffer is viewed as a
+    matrix with one row per such group. Within a row, the k-th record's copy of a field always sits
+    at the same bit position, which turns every field into a handful of whole-column shifts and
+    masks.
+    """
+    bit_size, per_group, group_bytes = _group_layout(model)
+    data, nbits = as_bytes(buffer)
+    count = nbits // bit_size
+    ngroups = count // per_group
+    groups = []
+    if ngroups:
+        rows = np.frombuffer(data, np.uint8, count=ngroups * group_bytes)
+        groups.append(rows.reshape(ngroups, group_bytes))
+    if count % per_group:
+        # The last group is incomplete, pad a copy of it rather than copying the whole buffer.
+        tail = bytes(data[ngroups * group_bytes :]).ljust(group_bytes, b"\0")
+        groups.append(np.frombuffer(tail, np.uint8).reshape(1, group_bytes))
+
+    columns = {}
+    offset = 0
+    for name, field in model.fields.items():
+        pos = offset
+        offset += field.bits
+        if field.placeholder:
+            continue
+        dtype = column_dtype(name, field)
+        item, shape = _items(field)
+        parts = []
+        for rows in groups:
+            values = np.empty((len(rows), per_group, math.prod(shape)), dtype)
+            for k in range(per_group):
+                for j in range(values.shape[2]):
+                    values[:, k, j] = _decode(item, rows, k * bit_size + pos + j * item.bits)
+            parts.append(values.reshape(-1, *shape))
+        if parts:
+            columns[name] = np.concatenate(parts)[:count]
+        else:
+            columns[name] = np.empty((0, *shape), dtype)
+    return columns
+
+
+def encode_columns(model: type[BitModel], columns: dict[str, np.ndarray]) -> bytes:
+    """Pack equal-length per-field arrays into back-to-back records of `model`.
+
+    The inverse of `decode_columns`: every field is range checked and converted to raw bits for the
+    whole column at once, then OR-ed into a zeroed matrix with one row per `lcm(bit_size, 8)` group
+    of records, so placeholders are zero without any extra work.
+    """
+    bit_size, per_group, group_bytes = _group_layout(model)
+    names = [name for name, field in model.fields.items() if not field.placeholder]
+    if missing := [name for name in names if name not in columns]:
+        raise TypeError(f"missing columns: {', '.join(missing)}")
+    if unexpected := [name for name in columns if name not in names]:
+        raise TypeError(f"unexpected columns: {', '.join(unexpected)}")
+    columns = {name: np.asarray(columns[name]) for name in names}
+    for name in names:
+        _, shape = _items(model.fields[name])
+        if columns[name].shape[1:] != shape:
+            raise ValueError(
+                f"column {name!r} must have item shape {shape}, got {columns[name].shape[1:]}"
+            )
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"columns must all have the same length, got {sorted(lengths)}")
+    count = lengths.pop() if lengths else 0
+    if not count:
+        return b""
+
+    ngroups = -(-count // per_group)
+    rows = np.zeros((ngroups, group_bytes), np.uint8)
+    offset = 0
+    for name, field in model.fields.items():
+        pos = offset
+        offset += field.bits
+        if field.placeholder:
+            continue
+        column_dtype(name, field)
+        item, shape = _items(field)
+        raw = np.zeros((ngroups * per_group, math.prod(shape)), np.uint64)
+        raw[:count] = _raw(name, item, columns[name]).reshape(count, -1)
+        raw = raw.reshape(ngroups, per_group, -1)
+        for k in range(per_group):
+            for j in range(raw.shape[2]):
+                little = getattr(item, "byteorder", None) == "little"
+                _insert(rows, k * bit_size + pos + j * item.bits, item.bits, raw[:, k, j], little)
+    return rows.tobytes()[: -(-count * bit_size // 8)]
+
+
+def column_dtype(name: str, field: Field) -> np.dtype:
+    if isinstance(field, Array):
+        return column_dtype(name, field.item)
+    if field.bits > 64:
+        raise ValueError(f"field {name!r} is {field.bits} bits wide, columns are limited to 64")
+    match field:
+        case UInt():
+            return np.dtype(f"u{_int_bytes(field.bits)}")
+        case Int():
+            return np.dtype(f"i{_int_bytes(field.bits)}")
+        case Bool():
+            return np.dtype(np.bool_)
+        case Float():
+            return np.dtype(f"f{field.bits // 8}")
+        case _:
+            raise TypeError(f"field {name!r} of type {type(field).__name__} has no column dtype")
+
+
+def _items(field: Field) -> tuple[Field, tuple[int, ...]]:
+    """Field of the individual values of a column and their shape within one record."""
+    if isinstance(field, Array):
+        return field.item, (field.count,)
+    return field, ()
+
+
+def _int_bytes(bits: int) -> int:
+    return next(n for n in (1, 2, 4, 8) if bits <= n * 8)
+
+
+def _strided(rows: np.ndarray, first: int, dtype: str) -> np.ndarray:
+    """Column of `dtype` values starting at byte `first` of every row, viewed in place."""
+    return np.ndarray((len(rows),), dtype, buffer=rows, offset=first, strides=(rows.shape[1],))
+
+
+def _decode(field: Field, rows: np.ndarray, pos: int) -> np.ndarray:
+    """Values of `field` starting at bit `pos` of every row."""
+    little = getattr(field, "byteorder", None) == "little"
+    if isinstance(field, Float) and pos % 8 == 0:
+        # Byte-aligned floats are reinterpreted in place, no round trip through integers.
+        return _strided(rows, pos // 8, f"{'<' if little else '>'}f{field.bits // 8}")
+    return _convert(field, _extract(rows, pos, field.bits, little))
+
+
+def _extract(rows: np.ndarray, pos: int, bits: int, little: bool = False) -> np.ndarray:
+    """Unsigned value of the `bits` wide field starting at bit `pos` of every row, as uint64."""
+    first, shift = divmod(pos, 8)
+    last = (pos + bits - 1) // 8
+    if shift == 0 and bits in (8, 16, 32, 64):
+        # Whole bytes: reinterpret the column in place with a strided view in the right byte order.
+        return _strided(rows, first, f"{'<' if little else '>'}u{bits // 8}").astype(np.uint64)
+    word = np.zeros(len(rows), np.uint64)
+    for j in range(first, min(last, first + 7) + 1):
+        word = (word << 8) | rows[:, j]
+    if last - first < 8:
+        word >>= (last - first + 1) * 8 - shift - bits
+    else:
+        # A field of 58 bits or more straddling nine bytes: pull the top of the ninth byte in.
+        word = (word << shift) | (rows[:, last] >> (8 - shift)).astype(np.uint64)
+        word >>= 64 - bits
+    if bits < 64:
+        word &= (1 << bits) - 1
+    return _byteswap(word, bits) if little else word
+
+
+def _insert(rows: np.ndarray, pos: int, bits: int, raw: np.ndarray, little: bool = False):
+    """OR the `bits` wide uint64 values in `raw` into every row starting at bit `pos`."""
+    first, shift = divmod(pos, 8)
+    last = (pos + bits - 1) // 8
+    if shift == 0 and bits in (8, 16, 32, 64):
+        _strided(rows, first, f"{'<' if little else '>'}u{bits // 8}")[:] = raw
+        return
+    if little:
+        raw = _byteswap(raw, bits)
+    end = pos + bits
+    for j in range(first, last):
+        rows[:, j] |= ((raw >> (end - 8 * (j + 1))) & 0xFF).astype(np.uint8)
+    rows[:, last] |= ((raw << (8 * (last + 1) - end)) & 0xFF).astype(np.uint8)
+
+
+def _byteswap(raw: np.ndarray, bits: int) -> np.ndarray:
+    """Reverse the order of the low `bits // 8` bytes of every uint64 in `raw`."""
+    nbytes = bits // 8
+    swapped = np.zeros_like(raw)
+    for i in range(nbytes):
+        swapped |= ((raw >> np.uint64(8 * i)) & np.uint64(0xFF)) << np.uint64(8 * (nbytes - 1 - i))
+    return swapped
+
+
+def _raw(name: str, field: Field, column: np.ndarray) -> np.ndarray:
+    """Range check `column` against `field` and convert it to unsigned bits as uint64."""
+    match field:
+        case UInt() | Int():
+            if column.dtype != np.bool_ and not np.issubdtype(column.dtype, np.integer):
+                raise TypeError(f"column {name!r} must be integers, got {column.dtype}")
+            if isinstance(field, Int):
+                lo, hi = -(1 << (field.bits - 1)), 1 << (field.bits - 1)
+            else:
+                lo, hi = 0, 1 << field.bits
+            if len(column) and (int(column.min()) < lo or int(column.max()) >= hi):
+                bad = column[(column < lo) | (column >= hi)][0]
+                raise out_of_range(int(bad), lo, hi, signed=isinstance(field, Int))
+            raw = column.astype(np.int64).view(np.uint64)
+            if field.bits < 64:
+                raw &= (1 << field.bits) - 1
+            return raw
+        case Bool():
+            return (column != 0).astype(np.uint64)
+        case Float():
+            size = field.bits // 8
+            return column.astype(f">f{size}").view(f">u{size}").astype(np.uint64)
+        case _:
+            raise TypeError(f"field {name!r} of type {type(field).__name__} has no column dtype")
+
+
+def _group_layout(model: type[BitModel]) -> tuple[int, int, int]:
+    """Record size, records per byte-aligned group and group size in bytes for `model`."""
+    bit_size = model.bit_size
+    if bit_size is None:
+        raise TypeError(f"{model.__name__} does not have a fixed-width layout")
+    if model.bitorder == "lsb":
+        raise TypeError(f"{model.__name__} is LSB-first, columns only support MSB-first layouts")
+    group_bits = math.lcm(bit_size, 8)
+    return bit_size, group_bits // bit_size, group_bits // 8
+
+
+def _convert(field: Field, raw: np.ndarray) -> np.ndarray:
+    match field:
+        case Int():
+            signed = raw.view(np.int64)
+            if field.bits < 64:
+                half = 1 << (field.bits - 1)
+                signed = (signed ^ half) - half
+            return signed
+        case Bool():
+            return raw != 0
+        case Float():
+            return raw.astype(f"u{field.bits // 8}").view(f"f{field.bits // 8}")
+        case _:
+            return raw
@@ -0,0 +1,73 @@
+from array import array
+from collections.abc import Sequence
+from typing import overload, TYPE_CHECKING
+
+from .bitview import bitview
+
+if TYPE_CHECKING:
+    from .fields import Field
+
+
+class LazyItems[T](Sequence[T]):
+    """The `count` items of a `VarArray` section, decoded one at a time on first access.
+
+    Decoding the parent record only locates the items: fixed-width items sit at multiples of their
+    width, and variable-width ones get a compact `array` of their bit offsets into the section,
+    filled in by measuring each item without building it. Decoded items are cached.
+
+    The section's bits are copied, so the record doesn't change with, or keep alive, the buffer it
+    was decoded from.
+    """
+
+    def __init__(self, item: "Field[T]", buffer: bitview, count: int, offsets: array | None):
+        self.item = item
+        self._buffer = buffer.copy()
+        self._count = count
+        self._offsets = offsets
+        self._cache: dict[int, T] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, idx: int) -> T: ...
+    @overload
+    def __getitem__(self, idx: slice) -> list[T]: ...
+    def __getitem__(self, idx: int | slice) -> T | list[T]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self._count))]
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError(f"item index out of range: {idx=}")
+        try:
+            return self._cache[idx]
+        except KeyError:
+            pass
+        if self._offsets is None:
+            start = idx * self.item.bits
+        else:
+            start = self._offsets[idx]
+        val = self._cache[idx] = self.item.from_bytes(self._buffer[start:])[0]
+        return val
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    @property
+    def pristine(self) -> bool:
+        """Whether the bits from `to_bits` still match the items.
+
+        True until an item of a mutable type, a nested record or a list, has been handed out, as it
+        may have been changed in place since.
+        """
+        return all(isinstance(val, (int, float)) for val in self._cache.values())
+
+    def to_bits(self) -> bitview:
+        """Encoded bits of the whole section, as they were read."""
+        return self._buffer
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
@@ -0,0 +1,73 @@
+from typing import Any, TYPE_CHECKING
+
+import bitarray.util as util
+
+from .bitview import bitview
+
+if TYPE_CHECKING:
+    from .bit_model import BitModel
+    from .fields import Field
+
+
+class ModelView:
+    """Zero-copy window on a single record of `model` inside a larger buffer.
+
+    Nothing is decoded up front. The first read of a field slices its bits out of the underlying
+    `bitview` using the model's precomputed offsets and stores the value on the instance, so any
+    later read is a plain attribute lookup.
+
+    Fields are read in the model's `bitorder`. A buffer holding its bits in the other order keeps
+    their sequence, as with `from_bytes`.
+
+    When the buffer is writable (a `bytearray`, a writable `mmap`, ...), assigning to a field
+    encodes the value straight into the buffer at the field's offset. Assigning to a view over
+    read-only memory raises `TypeError`.
+    """
+
+    def __init__(self, model: "type[BitModel]", buffer: bitview):
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_buffer", buffer)
+
+    def __getattr__(self, name: str) -> Any:
+        offset, field = self._locate(name)
+        bits = self._buffer[offset : offset + field.bits]
+        if bits.bitorder == self._model.bitorder:
+            raw = bits.to_int()
+        else:
+            from .bit_model import view_int
+
+            raw = view_int(bits, field.bits, self._model.bitorder)
+        val = field.from_int(raw)
+        self.__dict__[name] = val
+        return val
+
+    def __setattr__(self, name: str, val: Any):
+        offset, field = self._locate(name)
+        raw = field.to_int(val)
+        endian = "little" if self._model.bitorder == "lsb" else "big"
+        self._buffer[offset : offset + field.bits] = util.int2ba(raw, field.bits, endian)
+        self.__dict__[name] = field.from_int(raw)
+
+    def _locate(self, name: str) -> "tuple[int, Field]":
+        # Underscored names are placeholders, and checking them first keeps internal lookups such
+        # as `_model` on a half-built copy from recursing back into `__getattr__`.
+        if name.startswith("_") or name not in self._model.offsets:
+            raise AttributeError(f"{type(self).__name__!r} object has no field {name!r}")
+        return self._model.offsets[name], self._model.fields[name]
+
+    def to_model(self) -> "BitModel":
+        return self._model.from_bytes(self._buffer)
+
+    def to_bytes(self) -> bytes:
+        return self._buffer.to_bytes()
+
+    def __bytes__(self) -> bytes:
+        return self.to_bytes()
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name, field in self._model.fields.items()
+            if not field.placeholder
+        )
+        return f"{type(self).__name__}[{self._model.__name__}]({values})"
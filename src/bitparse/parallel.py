@@ -0,0 +1,70 @@
+import math
+import os
+from typing import TYPE_CHECKING
+
+from .bitview import ceildiv
+from .record_file import RecordFile
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .bit_model import BitModel
+
+
+def decode_file_parallel[M: BitModel](
+    model: type[M],
+    path: str | os.PathLike,
+    workers: int | None = None,
+    columns: bool = False,
+    shard_size: int | None = None,
+) -> "list[M] | dict[str, np.ndarray]":
+    """Decode every record of a file of back-to-back `model` records across a process pool.
+
+    The file is cut into shards of about `shard_size` records, rounded to whole `lcm(bit_size, 8)`
+    groups so that every shard starts on a byte boundary. Workers receive the path and a record
+    range rather than the data, map the file themselves and send back either decoded records or,
+    with `columns=True`, one NumPy array per field. Results are merged in file order.
+    """
+    workers = workers or os.cpu_count() or 1
+    with RecordFile(model, path) as records:
+        count = len(records)
+    per_group = math.lcm(model.bit_size, 8) // model.bit_size
+    if shard_size is None:
+        # A few shards per worker evens out the load without paying too much per task.
+        shard_size = ceildiv(count, workers * 4)
+    shard_size = max(ceildiv(shard_size, per_group), 1) * per_group
+    shards = [(start, min(start + shard_size, count)) for start in range(0, count, shard_size)]
+
+    if workers == 1 or len(shards) <= 1:
+        parts = [_decode_shard(model, path, start, stop, columns) for start, stop in shards]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(min(workers, len(shards))) as pool:
+            parts = list(
+                pool.map(
+                    _decode_shard,
+                    *zip(*((model, path, start, stop, columns) for start, stop in shards)),
+                )
+            )
+
+    if columns:
+        import numpy as np
+
+        if not parts:
+            return model.decode_columns(b"")
+        return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+    return [record for part in parts for record in part]
+
+
+def _decode_shard[M: BitModel](
+    model: type[M], path: str | os.PathLike, start: int, stop: int, columns: bool
+) -> "list[M] | dict[str, np.ndarray]":
+    with RecordFile(model, path) as records:
+        if not columns:
+            return list(records.iter(start, stop))
+        bit_size = model.bit_size
+        with memoryview(records._mmap) as data:
+            shard = model.decode_columns(data[start * bit_size // 8 : ceildiv(stop * bit_size, 8)])
+        # Padding after the last record may hold extra records when they are narrower than a byte.
+        return {name: column[: stop - start] for name, column in shard.items()}
@@ -0,0 +1,106 @@
+import itertools
+import math
+import mmap
+import os
+from collections.abc import Iterator, Sequence
+from typing import overload, TYPE_CHECKING
+
+from .bitview import bitview, ceildiv
+from .model_view import ModelView
+
+if TYPE_CHECKING:
+    from .bit_model import BitModel
+
+
+class RecordFile[M: BitModel](Sequence[M]):
+    """Back-to-back fixed-width records of `model` in a file, memory-mapped instead of read.
+
+    Records are addressed by index in O(1) from the model's `bit_size`, so files larger than memory
+    can be sliced, iterated from any point or bisected without touching the pages in between.
+    Opening with `writable=True` maps the file read-write so that `view` can patch records in place.
+    """
+
+    def __init__(self, model: type[M], path: str | os.PathLike, writable: bool = False):
+        if model.bit_size is None:
+            raise TypeError(f"{model.__name__} does not have a fixed-width layout")
+        self.model = model
+        with open(path, "r+b" if writable else "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            # mmap refuses empty files, an empty buffer behaves the same for every read.
+            self._mmap = mmap.mmap(f.fileno(), 0, access=access) if size else None
+        self._bits = bitview(self._mmap if self._mmap is not None else b"", model.bitorder)
+        self._len = size * 8 // model.bit_size
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, idx: int) -> M: ...
+    @overload
+    def __getitem__(self, idx: slice) -> list[M]: ...
+    def __getitem__(self, idx: int | slice) -> M | list[M]:
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            if step == 1:
+                return list(self.iter(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        idx = self._index(idx)
+        if self.model.bit_size % 8:
+            return self.model.from_bytes(self._record(idx))
+        # Whole-byte records: a bytes slice of the map hits the decoder's fastest path.
+        byte_size = self.model.byte_size
+        return self.model.from_bytes(self._mmap[idx * byte_size : (idx + 1) * byte_size])
+
+    def __iter__(self) -> Iterator[M]:
+        return self.iter()
+
+    def view(self, idx: int) -> ModelView:
+        """Lazy view of record `idx`, writable if the file was opened with `writable=True`."""
+        return self.model.view(self._record(self._index(idx)))
+
+    def iter(
+        self, start: int = 0, stop: int | None = None, batch_size: int | None = None
+    ) -> Iterator[M] | Iterator[list[M]]:
+        """Decode records `start` to `stop` lazily, one at a time or in lists of `batch_size`.
+
+        Decoding starts at the byte-aligned group of records containing `start` so that the mapped
+        memory is handed to `iter_from_bytes` as is, without realigning it.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return
+        bit_size = self.model.bit_size
+        group_bits = math.lcm(bit_size, 8)
+        per_group = group_bits // bit_size
+        first = start // per_group * per_group
+        data = memoryview(self._mmap)[first * bit_size // 8 : ceildiv(stop * bit_size, 8)]
+        records = itertools.islice(self.model.iter_from_bytes(data), start - first, stop - first)
+        if batch_size is None:
+            yield from records
+        else:
+            while batch := list(itertools.islice(records, batch_size)):
+                yield batch
+
+    def close(self):
+        """Unmap the file. Fails with `BufferError` while views or iterators still use it."""
+        if self._mmap is not None:
+            self._bits = bitview(b"")
+            self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _index(self, idx: int) -> int:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"record index out of range: {idx=}")
+        return idx
+
+    def _record(self, idx: int) -> bitview:
+        bit_size = self.model.bit_size
+        return self._bits[idx * bit_size : (idx + 1) * bit_size]
@@ -0,0 +1,194 @@
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import overload, TYPE_CHECKING
+
+from .bitview import bitview, ceildiv
+from .tagged_union import TaggedUnion
+
+if TYPE_CHECKING:
+    from .bit_model import BitModel
+
+# Index files start with a magic number, the size in bytes of the capture they were built from and
+# the CRC-32 of its last `CHECKED_BYTES` bytes, followed by native `Q` bit offsets: where each
+# record starts, then where the last one ends.
+INDEX_HEADER = struct.Struct("=8sQI4x")
+INDEX_MAGIC = b"bpindex2"
+# How much of the end of the indexed data is checksummed, to tell a capture that was appended to
+# from one that was rewritten.
+CHECKED_BYTES = 4096
+# Offsets found while scanning are written out in batches of this many.
+FLUSH_EVERY = 1 << 16
+
+
+def index_path_for(path: str | os.PathLike) -> str:
+    return os.fspath(path) + ".idx"
+
+
+def build_index[M: BitModel](
+    model: "type[M] | TaggedUnion[M]",
+    path: str | os.PathLike,
+    index_path: str | os.PathLike | None = None,
+) -> str:
+    """Scan a capture of back-to-back variable-width records once and save where each one starts.
+
+    Records are measured with `_measure`, which only decodes `VarArray` counts and union tags, not
+    whole records. The index goes to a sidecar file, `path + ".idx"` by default, and its path is
+    returned. An index left by an earlier call is reused as is when the capture hasn't changed, and
+    only extended from its last record when the capture has grown, as live captures do. Captures are
+    told apart by the checksum of the end of the indexed data, any other change triggers a rebuild.
+    Scanning stops at the first record that can't be measured, normally one still being written,
+    and picks up from there next time.
+    """
+    index_path = index_path_for(path) if index_path is None else os.fspath(index_path)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+    try:
+        with open(index_path, "r+b" if os.path.exists(index_path) else "w+b") as index:
+            pos = _resume(index, data, size)
+            if pos is not None:
+                _scan(model, bitview(data, model.bitorder), pos, index)
+                index.seek(0)
+                index.write(INDEX_HEADER.pack(INDEX_MAGIC, size, _checksum(data, size)))
+    finally:
+        if size:
+            data.close()
+    return index_path
+
+
+def _scan(model: "type[BitModel] | TaggedUnion", bits: bitview, pos: int, index):
+    """Append the end offset of every complete record from bit `pos` on to `index`.
+
+    Captures are written in whole bytes, so bits after a record that ends mid-byte in the last byte
+    are taken as padding, not as another record.
+    """
+    offsets = array("Q")
+    end = len(bits)
+    while pos < end:
+        try:
+            width = model._measure(bits[pos:])
+        except ValueError:
+            break
+        if not width or pos + width > end:
+            break
+        if pos % 8 and end - pos < 8:
+            # What's left after a record ending mid-byte is the padding of the last byte.
+            break
+        pos += width
+        offsets.append(pos)
+        if len(offsets) >= FLUSH_EVERY:
+            offsets.tofile(index)
+            del offsets[:]
+    offsets.tofile(index)
+
+
+def _checksum(data, size: int) -> int:
+    """CRC-32 of the bytes of `data` right before `size`."""
+    return zlib.crc32(data[max(size - CHECKED_BYTES, 0) : size])
+
+
+def _resume(index, data, size: int) -> int | None:
+    """Position the index file for appending and return the bit offset to scan from, or None if the
+    index is up to date."""
+    header = index.read(INDEX_HEADER.size)
+    if len(header) == INDEX_HEADER.size:
+        magic, indexed_size, checksum = INDEX_HEADER.unpack(header)
+        if (
+            magic == INDEX_MAGIC
+            and indexed_size <= size
+            and checksum == _checksum(data, indexed_size)
+        ):
+            if indexed_size == size:
+                return None
+            # Drop any half-written trailing offset before resuming from the last record's end.
+            count = (os.fstat(index.fileno()).st_size - INDEX_HEADER.size) // 8
+            if count:
+                index.seek(INDEX_HEADER.size + (count - 1) * 8)
+                last = array("Q")
+                last.fromfile(index, 1)
+                index.truncate(INDEX_HEADER.size + count * 8)
+                return last[0]
+    index.seek(0)
+    index.truncate()
+    index.write(INDEX_HEADER.pack(INDEX_MAGIC, 0, _checksum(data, 0)))
+    array("Q", [0]).tofile(index)
+    return 0
+
+
+class IndexedRecordFile[M: BitModel](Sequence[M]):
+    """Capture of back-to-back variable-width records, with O(1) access by record number.
+
+    Record boundaries come from the sidecar index of `build_index`, which is created or brought up
+    to date on open. The capture and the index are both memory-mapped: looking up a record reads two
+    offsets from the index and decodes only that record's bits, so queries by record number, or by
+    bisecting on a timestamp field, never rescan the capture.
+
+    `model` is a `BitModel` subclass, or a `TaggedUnion` for captures mixing several message types.
+    """
+
+    def __init__(
+        self,
+        model: "type[M] | TaggedUnion[M]",
+        path: str | os.PathLike,
+        index_path: str | os.PathLike | None = None,
+    ):
+        self.model = model
+        self._decode = model.decode if isinstance(model, TaggedUnion) else model.from_bytes
+        self.index_path = build_index(model, path, index_path)
+        self._mmap = None
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(self.index_path, "rb") as f:
+            self._index_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = memoryview(self._index_mmap)[INDEX_HEADER.size :].cast("Q")
+        self._msb = model.bitorder == "msb"
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, idx: int) -> M: ...
+    @overload
+    def __getitem__(self, idx: slice) -> list[M]: ...
+    def __getitem__(self, idx: int | slice) -> M | list[M]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"record index out of range: {idx=}")
+        start, stop = self._offsets[idx], self._offsets[idx + 1]
+        # Records are decoded from a copy of their bytes, lazily decoded items would otherwise keep
+        # the map exported and it couldn't be closed. A bytes slice also hits the fastest path of
+        # fixed-width decoders.
+        data = self._mmap[start // 8 : ceildiv(stop, 8)]
+        if self._msb and start % 8 == 0:
+            return self._decode(data)
+        shift = start % 8
+        return self._decode(bitview(data, self.model.bitorder)[shift : shift + stop - start])
+
+    def __iter__(self) -> Iterator[M]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def bit_range(self, idx: int) -> tuple[int, int]:
+        """Start and end bit offsets of record `idx` in the capture."""
+        return self._offsets[idx], self._offsets[idx + 1]
+
+    def close(self):
+        """Unmap the capture and its index."""
+        if self._mmap is not None:
+            self._mmap.close()
+        self._offsets.release()
+        self._index_mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,100 @@
+from collections.abc import AsyncIterator, Buffer, Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from .bitview import bitview, ceildiv
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .bit_model import BitModel
+
+
+class StreamDecoder[M: BitModel]:
+    """Push parser turning arbitrarily split chunks of bytes into fixed-width records of `model`.
+
+    Chunks are appended to a single `bytearray` and consumed whole bytes are deleted from its front,
+    which CPython does in amortized constant time, so nothing already buffered is copied again when
+    a new chunk arrives. Records that are not a whole number of bytes are tracked with a bit
+    position into the first buffered byte.
+
+    With `padded=True` every record instead takes up `byte_size` bytes, the framing produced by
+    writing `to_bytes()` one record after another.
+    """
+
+    def __init__(self, model: type[M], padded: bool = False):
+        if model.bit_size is None:
+            raise TypeError(f"{model.__name__} does not have a fixed-width layout")
+        self.model = model
+        self._stride = model.byte_size * 8 if padded else model.bit_size
+        self._buffer = bytearray()
+        self._pos = 0
+
+    def feed(self, chunk: Buffer) -> list[M]:
+        """Buffer `chunk` and return every record it completes, in order."""
+        self._buffer += chunk
+        count = (len(self._buffer) * 8 - self._pos) // self._stride
+        if not count:
+            return []
+        stop = self._pos + count * self._stride
+        if self._stride != self.model.bit_size:
+            # Padded records always start on a byte boundary, so `_pos` stays 0.
+            byte_size = self.model.byte_size
+            from_bytes = self.model.from_bytes
+            with memoryview(self._buffer) as data:
+                records = [
+                    from_bytes(data[i : i + byte_size]) for i in range(0, stop // 8, byte_size)
+                ]
+        elif self._pos % 8:
+            records = self.model.from_bytes_many(
+                bitview(self._buffer, self.model.bitorder)[self._pos : stop]
+            )
+        else:
+            with memoryview(self._buffer) as data:
+                records = self.model.from_bytes_many(data[self._pos // 8 : ceildiv(stop, 8)])
+        del records[count:]
+        del self._buffer[: stop // 8]
+        self._pos = stop % 8
+        return records
+
+    def decode(self, chunks: Iterable[Buffer]) -> Iterator[M]:
+        """Feed every chunk of `chunks` in turn, yielding records as soon as they are complete."""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+
+    @property
+    def pending_bits(self) -> int:
+        """Number of buffered bits that don't yet make up a whole record."""
+        return len(self._buffer) * 8 - self._pos
+
+
+async def read_record[M: BitModel](model: type[M], reader: "asyncio.StreamReader") -> M:
+    """Read exactly one `byte_size` record from `reader`.
+
+    Raises `asyncio.IncompleteReadError` if the stream ends first.
+    """
+    if model.bit_size is None:
+        raise TypeError(f"{model.__name__} does not have a fixed-width layout")
+    return model.from_bytes(await reader.readexactly(model.byte_size))
+
+
+async def iter_records[M: BitModel](
+    model: type[M], reader: "asyncio.StreamReader", chunk_size: int = 64 * 1024
+) -> AsyncIterator[M]:
+    """Yield `byte_size` records from `reader` until EOF, reading up to `chunk_size` bytes at once.
+
+    Raises `asyncio.IncompleteReadError` if the stream ends in the middle of a record.
+    """
+    decoder = StreamDecoder(model, padded=True)
+    while chunk := await reader.read(chunk_size):
+        for record in decoder.feed(chunk):
+            yield record
+    if decoder.pending_bits:
+        import asyncio
+
+        raise asyncio.IncompleteReadError(bytes(decoder._buffer), model.byte_size)
+
+
+async def write_record(record: "BitModel", writer: "asyncio.StreamWriter"):
+    """Write `record` as `to_bytes()` and wait until the writer's buffer has drained."""
+    writer.write(record.to_bytes())
+    await writer.drain()
@@ -0,0 +1,148 @@
+import mmap
+import os
+from dataclasses import replace
+from collections.abc import Buffer, Iterator, Mapping
+from typing import TYPE_CHECKING
+
+from .bit_model import BitModel, model_bits, view_int
+from .bitview import bitview
+from .fields import Field
+
+if TYPE_CHECKING:
+    from .record_index import IndexedRecordFile
+
+# Tags up to this wide are looked up in a list indexed by the raw tag, wider ones in a dict.
+MAX_TABLE_BITS = 16
+# Buffers that can be indexed and sliced by byte directly, `memoryview` is left out because its
+# items aren't necessarily bytes.
+BYTE_INDEXABLE = frozenset({bytes, bytearray, mmap.mmap})
+
+
+class TaggedUnion[M: BitModel]:
+    """Family of message models told apart by a shared tag field, e.g. a `u8` message type.
+
+    Every model declares `tag` as the same kind of field at the same bit offset, preceded only by
+    fixed-width fields. `decode` reads just the tag, then hands the buffer to the decoder of the
+    model registered for its value, so there is no trial parsing and the header is decoded once.
+    The lookup goes through a table built up front and indexed by the raw tag bits: a list for tags
+    of up to 16 bits, a dict otherwise.
+
+        messages = TaggedUnion("kind", {1: Ping, 2: Pong, 3: Data})
+        msg = messages.decode(packet)
+    """
+
+    def __init__(self, tag: str, models: Mapping[int, type[M]]):
+        if not models:
+            raise ValueError("a tagged union needs at least one model")
+        self.tag = tag
+        self.models = dict(models)
+        first = next(iter(self.models.values()))
+        self.field = field = tag_field(first, tag)
+        self.offset = tag_offset(first, tag)
+        self.bitorder = first.bitorder
+        for model in self.models.values():
+            other = tag_field(model, tag)
+            if replace(other, placeholder=False) != replace(field, placeholder=False):
+                raise TypeError(
+                    f"tag {tag!r} of {model.__name__} doesn't match {first.__name__}: "
+                    f"{other} != {field}"
+                )
+            if tag_offset(model, tag) != self.offset or model.bitorder != self.bitorder:
+                raise TypeError(f"tag {tag!r} of {model.__name__} is not at the same position")
+
+        decoders = {field.to_int(val): model for val, model in self.models.items()}
+        if field.bits <= MAX_TABLE_BITS:
+            self._table = [None] * (1 << field.bits)
+            for raw, model in decoders.items():
+                self._table[raw] = model
+        else:
+            self._table = decoders
+        # Whole-byte, byte-aligned big-endian tags are read straight off the buffer.
+        self._byte_range = None
+        if self.offset % 8 == 0 and field.bits % 8 == 0 and self.bitorder == "msb":
+            if getattr(field, "byteorder", None) in (None, "big"):
+                self._byte_range = (self.offset // 8, (self.offset + field.bits) // 8)
+
+    def decode(self, buffer: Buffer) -> M:
+        """Decode the record at the start of `buffer` with the model its tag selects."""
+        return self.model_for(buffer).from_bytes(buffer)
+
+    def iter_from_bytes(self, buffer: Buffer) -> Iterator[M]:
+        """Decode back-to-back records of any of the models, ignoring a trailing partial record."""
+        buffer = model_bits(buffer, self.bitorder)
+        tag_end = self.offset + self.field.bits
+        while len(buffer) >= tag_end:
+            try:
+                model = self.model_for(buffer)
+            except ValueError:
+                # Less than a byte left is the padding of a bit-packed stream, not a bad tag.
+                if len(buffer) < 8:
+                    return
+                raise
+            # As in `BitModel.iter_from_bytes`, a record that doesn't fit ends the batch.
+            try:
+                if model._measure(buffer) > len(buffer):
+                    return
+            except ValueError:
+                return
+            if model.bit_size is None:
+                record, buffer = model._read(buffer)
+            else:
+                record, buffer = model.from_bytes(buffer), buffer[model.bit_size :]
+            yield record
+
+    def from_bytes_many(self, buffer: Buffer) -> list[M]:
+        return list(self.iter_from_bytes(buffer))
+
+    def open_indexed(
+        self, path: str | os.PathLike, index_path: str | os.PathLike | None = None
+    ) -> "IndexedRecordFile[M]":
+        """Open a capture of back-to-back records of any of the models for access by record number.
+
+        The capture is scanned once to write a sidecar offset index, see `IndexedRecordFile`.
+        """
+        from .record_index import IndexedRecordFile
+
+        return IndexedRecordFile(self, path, index_path)
+
+    def model_for(self, buffer: Buffer) -> type[M]:
+        """Model registered for the tag of the record at the start of `buffer`."""
+        if self._byte_range is not None and type(buffer) in BYTE_INDEXABLE:
+            lo, hi = self._byte_range
+            if len(buffer) < hi:
+                raise ValueError(f"expected at least {hi} bytes, got {len(buffer)}")
+            raw = buffer[lo] if hi - lo == 1 else int.from_bytes(buffer[lo:hi])
+        else:
+            view = bitview(buffer, self.bitorder)[self.offset :]
+            raw = view_int(view, self.field.bits, self.bitorder)
+        try:
+            model = self._table[raw]
+        except KeyError:
+            model = None
+        if model is None:
+            raise ValueError(f"no model registered for {self.tag}={self.field.from_int(raw)!r}")
+        return model
+
+    def _measure(self, buffer: bitview) -> int:
+        return self.model_for(buffer)._measure(buffer)
+
+
+def tag_field(model: type[BitModel], tag: str) -> Field:
+    try:
+        field = model.fields[tag]
+    except KeyError:
+        raise TypeError(f"{model.__name__} has no tag field {tag!r}") from None
+    if field.bits is None:
+        raise TypeError(f"tag field {tag!r} of {model.__name__} must have a fixed width")
+    return field
+
+
+def tag_offset(model: type[BitModel], tag: str) -> int:
+    offset = 0
+    for name, field in model.fields.items():
+        if name == tag:
+            break
+        if field.bits is None:
+            raise TypeError(f"tag field {tag!r} of {model.__name__} follows a variable-width field")
+        offset += field.bits
+    return offset
@@ -1,7 +1,14 @@
+import dataclasses
+import struct
+from typing import Annotated
+
 import pytest
 from bitarray import bitarray
+import bitarray.util as util
+from bitparse import bitview
 from bitparse.bit_model import BitModel
-from bitparse.fields import u4, u7, u8, u12, u16, u32, i8, i16, i32, b1, b8, f32, f64, UInt, Int, Bool
+from bitparse.fields import u3, u4, u7, u8, u9, u12, u16, u32, i4, i8, i16, i32, b1, b8
+from bitparse.fields import f16, f32, f64, Array, Float, UInt, Int, VarArray
 
 
 class SimpleUInt(BitModel):
@@ -31,6 +38,63 @@ class FloatFields(BitModel):
     value64: f64
 
 
+class UnalignedFloats(BitModel):
+    flag: b1
+    value32: f32
+    _padding: u7
+    value16: f16
+
+
+class Header(BitModel):
+    version: u4
+    kind: u4
+    seq: u16
+
+
+class Message(BitModel):
+    flag: b1
+    header: Header
+    value: i8
+    _padding: u7
+
+
+class Waveform(BitModel):
+    channel: u4
+    samples: Annotated[list[int], Array(u12, 8)]
+    gains: Annotated[list[int], Array(i16, 3)]
+    _padding: u4
+
+
+class LittleEndian(BitModel, byteorder="little"):
+    a: u8
+    b: u16
+    c: i32
+    d: f32
+
+
+class MixedEndian(BitModel):
+    flag: b1
+    a: Annotated[int, UInt(16, byteorder="little")]
+    b: Annotated[int, Int(16, byteorder="little")]
+    c: u16
+    d: Annotated[float, Float(32, byteorder="little")]
+    _padding: u7
+
+
+class CanSignals(BitModel, bitorder="lsb"):
+    mode: u3
+    speed: u9
+    delta: i4
+    active: b1
+    reading: f16
+    _padding: u7
+
+
+class LsbBytes(BitModel, bitorder="lsb"):
+    a: u8
+    b: u16
+
+
 class MixedTypes(BitModel):
     count: u8
     enabled: b1
@@ -147,6 +211,23 @@ def test_float_fields_unparsing():
     assert abs(roundtrip.value64 - 42.0) < 0.001
 
 
+def test_unaligned_float_fields_roundtrip():
+    model = UnalignedFloats(flag=True, value32=-1.25, value16=0.5)
+    data = model.to_bytes()
+    assert data == b"\xdf\xd0\x00\x00\x00\x38\x00"
+    roundtrip = UnalignedFloats.from_bytes(data)
+    assert (roundtrip.flag, roundtrip.value32, roundtrip.value16) == (True, -1.25, 0.5)
+
+
+def test_float_field_from_bitview():
+    bits = bitarray(endian="big")
+    bits.frombytes(b"\x0f" + struct.pack(">f", 3.5))
+    for view in (bitview(bits)[8:], bitview(bitarray("101") + bits[8:])[3:]):
+        val, rest = Float(32).from_bytes(view)
+        assert val == 3.5
+        assert len(rest) == 0
+
+
 def test_mixed_types_parsing():
     data = b"\x0a\x80\x00\xfe\xd4"
     model = MixedTypes.from_bytes(data)
@@ -217,3 +298,420 @@ def test_placeholder_not_in_init():
     assert model.temperature == 100
     with pytest.raises(AttributeError):
         _ = model._padding
+
+
+def test_short_buffer_raises():
+    with pytest.raises(ValueError):
+        MultipleUInts.from_bytes(b"\x01\x02\x03")
+
+
+def test_parsing_from_unaligned_bitview():
+    arr = bitarray("101") + bitarray()
+    arr.frombytes(b"\x0a\x80\x00\xfe\xd4")
+    model = MixedTypes.from_bytes(bitview(arr)[3:])
+    assert model.count == 10
+    assert model.enabled
+    assert model.temperature == -300
+
+
+def test_compiled_parsing_matches_field_parsing():
+    data = b"\xde\xad\xbe\xef"
+    model = NonStandardBitSizes.from_bytes(data)
+    buffer = bitview(data)
+    for name, field in NonStandardBitSizes.fields.items():
+        val, buffer = field.from_bytes(buffer)
+        assert getattr(model, name) == val
+
+
+def test_unparsing_out_of_range_raises():
+    with pytest.raises(OverflowError):
+        MultipleUInts(a=256, b=0, c=0).to_bytes()
+    with pytest.raises(OverflowError):
+        MultipleUInts(a=-1, b=0, c=0).to_bytes()
+    with pytest.raises(OverflowError):
+        SignedInts(small=-129, medium=0, large=0).to_bytes()
+    with pytest.raises(OverflowError):
+        NonStandardBitSizes(a=0, b=0x1000, c=0).to_bytes()
+
+
+def test_compiled_unparsing_matches_field_unparsing():
+    model = NonStandardBitSizes(a=0x12, b=0x345, c=0x6)
+    arr = bitarray()
+    for name, field in NonStandardBitSizes.fields.items():
+        arr.extend(field.to_bits(getattr(model, name)))
+    assert model.to_bytes() == arr.tobytes()
+
+
+def test_struct_layout_detection():
+    assert MultipleUInts._struct.format == ">BHI"
+    assert SignedInts._struct.format == ">bhi"
+    assert FloatFields._struct.format == ">fd"
+    assert MixedTypes._struct is None
+    assert NonStandardBitSizes._struct is None
+
+
+def test_struct_layout_parsing_from_unaligned_bitview():
+    arr = bitarray("1")
+    arr.frombytes(b"\x01\x02\x03\x04\x05\x06\x07")
+    model = MultipleUInts.from_bytes(bitview(arr)[1:])
+    assert (model.a, model.b, model.c) == (0x01, 0x0203, 0x04050607)
+
+
+def test_from_bytes_many_struct_layout():
+    data = b"\x01\x02\x03\x04\x05\x06\x07" + b"\xaa\xbb\xcc\xdd\xee\xff\x00" + b"\x01\x02"
+    models = MultipleUInts.from_bytes_many(data)
+    assert len(models) == 2
+    assert (models[0].a, models[0].b, models[0].c) == (0x01, 0x0203, 0x04050607)
+    assert (models[1].a, models[1].b, models[1].c) == (0xAA, 0xBBCC, 0xDDEEFF00)
+
+
+def test_from_bytes_many_bit_packed_records():
+    values = [(True, False, True), (False, True, False), (True, True, True), (False, False, True)]
+    arr = bitarray()
+    for flag1, flag2, byte_flag in values:
+        arr.extend([flag1, flag2])
+        arr.extend(f"{int(byte_flag):08b}")
+    models = BoolFields.from_bytes_many(arr.tobytes() + b"\x00")
+    assert [(m.flag1, m.flag2, m.byte_flag) for m in models] == values
+
+
+def test_iter_from_bytes_unaligned_bitview():
+    arr = bitarray("1")
+    for i in range(5):
+        arr.frombytes(SignedInts(small=i, medium=-i, large=i * 1000).to_bytes())
+    models = list(SignedInts.iter_from_bytes(bitview(arr)[1:]))
+    assert [(m.small, m.medium, m.large) for m in models] == [(i, -i, i * 1000) for i in range(5)]
+
+
+def test_layout_metadata():
+    assert MultipleUInts.bit_size == 56
+    assert MultipleUInts.byte_size == 7
+    assert MultipleUInts.offsets == {"a": 0, "b": 8, "c": 24}
+    assert BoolFields.bit_size == 10
+    assert BoolFields.byte_size == 2
+    assert MixedTypes.offsets == {
+        "count": 0,
+        "enabled": 8,
+        "_padding": 9,
+        "_padding2": 16,
+        "temperature": 24,
+    }
+
+
+def test_layout_metadata_sizes_buffers():
+    models = [NonStandardBitSizes(a=i, b=i * 3, c=i % 16) for i in range(4)]
+    buffer = bytearray(NonStandardBitSizes.byte_size * len(models))
+    for i, model in enumerate(models):
+        start = i * NonStandardBitSizes.byte_size
+        buffer[start : start + NonStandardBitSizes.byte_size] = model.to_bytes()
+    assert [m.b for m in NonStandardBitSizes.from_bytes_many(buffer)] == [0, 3, 6, 9]
+
+
+def test_nested_model_roundtrip():
+    model = Message(flag=True, header=Header(version=1, kind=2, seq=0x1234), value=-2)
+    data = model.to_bytes()
+    assert data == b"\x89\x09\x1a\x7f\x00"
+    decoded = Message.from_bytes(data)
+    assert (decoded.flag, decoded.value) == (True, -2)
+    assert (decoded.header.version, decoded.header.kind, decoded.header.seq) == (1, 2, 0x1234)
+    assert Message.bit_size == 40
+    assert Message.offsets == {"flag": 0, "header": 1, "value": 25, "_padding": 33}
+
+
+def test_nested_model_is_decoded_lazily():
+    data = Message(flag=False, header=Header(version=3, kind=4, seq=5), value=6).to_bytes()
+    decoded = Message.from_bytes(data)
+    assert "header" not in vars(decoded)
+    assert decoded.to_bytes() == data
+    assert "header" not in vars(decoded)
+    header = decoded.header
+    assert decoded.header is header
+    header.seq = 7
+    assert Message.from_bytes(decoded.to_bytes()).header.seq == 7
+
+
+def test_nested_model_assigned_without_reading():
+    data = Message(flag=True, header=Header(version=1, kind=2, seq=3), value=-4).to_bytes()
+    message = Message.from_bytes(data)
+    message.header = Header(version=9, kind=9, seq=99)
+    assert message.header.seq == 99
+    expected = Message(flag=True, header=Header(version=9, kind=9, seq=99), value=-4).to_bytes()
+    assert message.to_bytes() == expected
+    assert message._to_bits().tobytes() == expected
+
+
+def test_nested_model_batch_and_view():
+    models = [
+        Message(flag=i % 2 == 0, header=Header(version=i, kind=0, seq=i), value=i) for i in range(5)
+    ]
+    decoded = Message.from_bytes_many(b"".join(m.to_bytes() for m in models))
+    assert [m.header.version for m in decoded] == list(range(5))
+    view = Message.view(models[3].to_bytes())
+    assert view.header.seq == 3
+
+
+def test_nested_model_overflow():
+    with pytest.raises(OverflowError):
+        Message(flag=True, header=Header(version=16, kind=0, seq=0), value=0).to_bytes()
+
+
+def test_array_roundtrip():
+    model = Waveform(channel=5, samples=[0, 1, 2, 0xFFF, 4, 5, 6, 7], gains=[-1, 0, 300])
+    data = model.to_bytes()
+    assert Waveform.bit_size == 4 + 8 * 12 + 3 * 16 + 4
+    assert data[:4] == b"\x50\x00\x00\x10"
+    decoded = Waveform.from_bytes(data)
+    assert decoded.channel == 5
+    assert decoded.samples == [0, 1, 2, 0xFFF, 4, 5, 6, 7]
+    assert decoded.gains == [-1, 0, 300]
+    assert Waveform.from_bytes_many(data * 3)[2].samples == decoded.samples
+
+
+def test_array_field_from_bitview():
+    field = Array(u4, 3)
+    val, rest = field.from_bytes(bitview(bitarray("1010010100001")))
+    assert val == [10, 5, 0]
+    assert len(rest) == 1
+    assert field.to_bits([10, 5, 0]) == bitarray("101001010000")
+
+
+def test_array_errors():
+    with pytest.raises(ValueError):
+        Waveform(channel=0, samples=[0] * 7, gains=[0, 0, 0]).to_bytes()
+    with pytest.raises(OverflowError):
+        Waveform(channel=0, samples=[0] * 7 + [4096], gains=[0, 0, 0]).to_bytes()
+    with pytest.raises(OverflowError):
+        Waveform(channel=0, samples=[0] * 8, gains=[0, 0, 1 << 15]).to_bytes()
+
+
+def test_array_of_models():
+    field = Array(Header, 2)
+    raw = field.to_int([Header(version=1, kind=2, seq=3), Header(version=4, kind=5, seq=6)])
+    assert raw == 0x120003_450006
+    assert [(h.version, h.kind, h.seq) for h in field.from_int(raw)] == [(1, 2, 3), (4, 5, 6)]
+
+
+def test_little_endian_model():
+    data = struct.pack("<BHif", 1, 0x0203, -5, 1.5)
+    assert LittleEndian._struct.format == "<BHif"
+    model = LittleEndian.from_bytes(data)
+    assert (model.a, model.b, model.c, model.d) == (1, 0x0203, -5, 1.5)
+    assert model.to_bytes() == data
+    assert LittleEndian.from_bytes(bitview(data)).b == 0x0203
+
+
+def test_mixed_endian_model():
+    model = MixedEndian(flag=True, a=0x1234, b=-2, c=0x1234, d=2.0)
+    data = model.to_bytes()
+    assert MixedEndian._struct is None
+    assert data == bytes.fromhex("9a 09 7f 7f 89 1a 00 00 00 20 00")
+    for decoded in (MixedEndian.from_bytes(data), MixedEndian._read(bitview(data))[0]):
+        assert (decoded.a, decoded.b, decoded.c, decoded.d) == (0x1234, -2, 0x1234, 2.0)
+    assert model._to_bits().tobytes() == data
+    with pytest.raises(OverflowError):
+        MixedEndian(flag=True, a=1 << 16, b=0, c=0, d=0.0).to_bytes()
+    with pytest.raises(OverflowError):
+        MixedEndian(flag=True, a=0, b=-(1 << 15) - 1, c=0, d=0.0).to_bytes()
+
+
+def test_little_endian_fields():
+    field = Int(16, byteorder="little")
+    assert field.from_bytes(bitview(b"\xfe\xff\x01"))[0] == -2
+    assert field.to_bits(-2).tobytes() == b"\xfe\xff"
+    assert UInt(24, byteorder="little").from_int(0x010203) == 0x030201
+    with pytest.raises(ValueError):
+        UInt(12, byteorder="little")
+    with pytest.raises(ValueError):
+        UInt(16, byteorder="middle")
+
+
+def lsb_fields(data, widths):
+    """Reference decoding: consecutive LSB-first unsigned fields of the given widths."""
+    arr = bitarray(buffer=data, endian="little")
+    values, pos = [], 0
+    for width in widths:
+        values.append(int(arr[pos : pos + width][::-1].to01(), 2))
+        pos += width
+    return values
+
+
+def test_lsb_first_model():
+    model = CanSignals(mode=5, speed=300, delta=-3, active=True, reading=1.5)
+    data = model.to_bytes()
+    assert CanSignals.bit_size == 40
+    mode, speed, delta, active, reading, _ = lsb_fields(data, [3, 9, 4, 1, 16, 7])
+    assert (mode, speed, delta, active) == (5, 300, 0b1101, 1)
+    assert reading == int.from_bytes(struct.pack(">e", 1.5))
+    decoded = CanSignals.from_bytes(data)
+    assert (decoded.mode, decoded.speed, decoded.delta, decoded.active) == (5, 300, -3, True)
+    assert decoded.reading == 1.5
+    assert model._to_bits().tobytes() == data
+
+
+def test_lsb_first_many_and_bitviews():
+    data = bytes(range(3, 256, 11))
+    widths = [3, 9, 4, 1, 16, 7] * (len(data) // 5)
+    expected = lsb_fields(data, widths)[1::6]
+    assert [m.speed for m in CanSignals.from_bytes_many(data)] == expected
+    lsb_view = bitview(b"\xff" + data, bitorder="lsb")[8:]
+    assert [m.speed for m in CanSignals.from_bytes_many(lsb_view)] == expected
+    assert CanSignals._read(lsb_view)[0].speed == expected[0]
+    assert CanSignals.view(data).speed == expected[0]
+
+
+def test_bitview_in_other_bitorder():
+    # Every path reads the bits in sequence, in the model's order: from an LSB-first view, the bits
+    # of 0xa5 0x01 are 101 00101 10000000.
+    msb = make_model("Msb", a=u3, b=Annotated[int, UInt(5)], c=u8)
+    lsb = type(BitModel)(
+        "Lsb", (BitModel,), {"__annotations__": msb.__annotations__}, bitorder="lsb"
+    )
+    for model, order, expected in [(msb, "lsb", (5, 5, 0x80)), (lsb, "msb", (5, 20, 0x80))]:
+        data = bytearray(b"\xa5\x01")
+        view = bitview(data, order)
+        decoded = [
+            model.from_bytes(view),
+            model.from_bytes_many(view)[0],
+            model._read(view)[0],
+            model.view(view),
+            model.view(view).to_model(),
+        ]
+        for record in decoded:
+            assert (record.a, record.b, record.c) == expected
+        model.view(view).c = 1
+        assert data == b"\xa5\x80"
+        assert model.from_bytes(view).c == 1
+
+
+def test_lsb_first_whole_bytes_use_struct():
+    assert LsbBytes._struct.format == "<BH"
+    assert LsbBytes.from_bytes(b"\x01\x02\x03").b == 0x0302
+    assert LsbBytes(a=1, b=0x0302).to_bytes() == b"\x01\x02\x03"
+
+
+def test_lsb_first_rejects_msb_fields():
+    with pytest.raises(TypeError):
+
+        class WithByteOrder(BitModel, bitorder="lsb"):
+            a: Annotated[int, UInt(16, byteorder="big")]
+
+    with pytest.raises(TypeError):
+
+        class WithArray(BitModel, bitorder="lsb"):
+            a: Annotated[list[int], Array(u4, 2)]
+
+
+def test_nested_models_share_the_bitorder():
+    for model in (CanSignals, LsbBytes):
+        with pytest.raises(TypeError, match="lsb-first"):
+            make_model("MsbOuter", a=u8, inner=model)
+    with pytest.raises(TypeError):
+        make_model("MsbItems", items=Annotated[list, Array(LsbBytes, 2)])
+    with pytest.raises(TypeError):
+        make_model("MsbVarItems", n=u8, items=Annotated[list, VarArray(LsbBytes, count="n")])
+    with pytest.raises(TypeError):
+        type(BitModel)("LsbOuter", (BitModel,), {"__annotations__": {"h": Header}}, bitorder="lsb")
+
+
+def make_model(name, **annotations):
+    return type(BitModel)(name, (BitModel,), {"__annotations__": annotations})
+
+
+def test_class_creation_is_silent(capsys):
+    make_model("Quiet", a=u8)
+    assert capsys.readouterr() == ("", "")
+
+
+def test_identical_layouts_share_generated_code():
+    first = make_model("First", a=u4, b=i8, _pad=u4, c=f16)
+    second = make_model("Second", a=u4, b=i8, _pad=u4, c=f16)
+    assert first.from_bytes.__func__ is second.from_bytes.__func__
+    assert first.__init__ is second.__init__
+    assert first.to_bytes is second.to_bytes
+    assert first.fields == second.fields
+    record = second.from_bytes(first(a=1, b=-2, c=0.5).to_bytes())
+    assert type(record) is second
+    assert (record.a, record.b, record.c) == (1, -2, 0.5)
+
+
+def test_fields_that_cant_be_keyed_are_not_cached():
+    @dataclasses.dataclass
+    class Labelled(UInt):
+        labels: dict = dataclasses.field(default_factory=dict)
+
+    class Scaled:
+        """A field following the protocol without being a dataclass."""
+
+        def __init__(self, bits, scale):
+            self.bits, self.scale, self.placeholder = bits, scale, False
+
+        def from_bytes(self, buffer):
+            return self.from_int(buffer[: self.bits].to_int()), buffer[self.bits :]
+
+        def to_bits(self, val):
+            return util.int2ba(self.to_int(val), length=self.bits)
+
+        def from_int(self, raw):
+            return raw * self.scale
+
+        def to_int(self, val):
+            return round(val / self.scale)
+
+    labelled = Annotated[int, Labelled(8, labels={1: "on"})]
+    scaled = Annotated[float, Scaled(8, 0.5)]
+    first = make_model("First", a=labelled, b=scaled, _c=scaled)
+    second = make_model("Second", a=labelled, b=scaled, _c=scaled)
+    assert first.from_bytes.__func__ is not second.from_bytes.__func__
+    assert first.fields["_c"].placeholder and not first.fields["b"].placeholder
+    record = second.from_bytes(first(a=1, b=2.5).to_bytes())
+    assert (record.a, record.b) == (1, 2.5)
+
+
+def test_different_layouts_get_their_own_code():
+    base = make_model("Base", a=u8, b=u8)
+    assert make_model("Renamed", a=u8, c=u8).from_bytes.__func__ is not base.from_bytes.__func__
+    assert make_model("Wider", a=u8, b=u16).from_bytes.__func__ is not base.from_bytes.__func__
+    assert make_model("Signed", a=u8, b=i8).from_bytes.__func__ is not base.from_bytes.__func__
+    assert make_model("Pad", a=u8, _b=u8).from_bytes.__func__ is not base.from_bytes.__func__
+    lsb = type(BitModel)(
+        "Lsb", (BitModel,), {"__annotations__": {"a": u8, "b": u8}}, bitorder="lsb"
+    )
+    assert lsb.from_bytes.__func__ is not base.from_bytes.__func__
+
+    inner_a = make_model("Inner", x=u4, y=u4)
+    inner_b = make_model("Inner", x=u4, y=u4)
+    outer_a = make_model("Outer", inner=inner_a)
+    outer_b = make_model("Outer", inner=inner_b)
+    assert outer_a.from_bytes.__func__ is not outer_b.from_bytes.__func__
+    assert type(outer_b.from_bytes(b"\x12").inner) is inner_b
+
+
+def test_variable_width_subclass_of_fixed_width_model():
+    class Fixed(BitModel):
+        a: u8
+        b: u16
+
+    class Variable(Fixed):
+        n: u8
+        xs: Annotated[list[int], VarArray(u8, count="n")]
+
+    record = Variable.from_bytes(b"\x02\x05\x06\x07")
+    assert (record.n, list(record.xs)) == (2, [5, 6])
+    assert not hasattr(record, "a")
+    assert Variable(n=1, xs=[3]).to_bytes() == b"\x01\x03"
+    assert [r.n for r in Variable.from_bytes_many(b"\x01\x03\x00")] == [1, 0]
+    assert Variable._struct is None
+    assert (Variable.bit_size, Variable.byte_size, Variable.offsets) == (None, None, None)
+    with pytest.raises(TypeError):
+        Variable._from_int(0)
+
+
+def test_memoryview_with_wide_items():
+    data = MultipleUInts(a=1, b=0x0203, c=0x04050607).to_bytes() + b"\x00"
+    view = memoryview(data).cast("H")
+    assert len(view) < MultipleUInts.byte_size
+    decoded = MultipleUInts.from_bytes(view)
+    assert (decoded.a, decoded.b, decoded.c) == (1, 0x0203, 0x04050607)
+    decoded = NonStandardBitSizes.from_bytes(memoryview(bytes(range(8))).cast("I"))
+    assert decoded.a == NonStandardBitSizes.from_bytes(bytes(range(8))).a
+    assert [m.a for m in MultipleUInts.from_bytes_many(view)] == [1]
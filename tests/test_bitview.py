@@ -1,6 +1,7 @@
 import pytest
 
 from bitarray import bitarray
+import bitarray.util as util
 from bitparse import bitview
 
 
@@ -248,3 +249,115 @@ def test_to_int_signed_negative():
     view = bitview(arr)
     assert view.to_int(signed=True) == -78
     assert view.to_int(signed=False) == 178
+
+
+def test_setitem_index():
+    data = bytearray(b"\x00")
+    view = bitview(data)
+    view[0] = 1
+    view[-1] = 1
+    assert data == bytearray(b"\x81")
+    with pytest.raises(IndexError):
+        view[8] = 1
+
+
+def test_setitem_slice():
+    data = bytearray(b"\x00\x00")
+    view = bitview(data)
+    view[3:7] = bitarray("1111")
+    assert data == bytearray(b"\x1e\x00")
+    view[8::2] = [1, 1, 1, 1]
+    assert data == bytearray(b"\x1e\xaa")
+    with pytest.raises(ValueError):
+        view[0:4] = [1, 1]
+
+
+def test_set_int():
+    data = bytearray(b"\x00\x00")
+    view = bitview(data)
+    view[4:12].set_int(0xAB)
+    assert data == bytearray(b"\x0a\xb0")
+    view[12:16].set_int(-1, signed=True)
+    assert data == bytearray(b"\x0a\xbf")
+    assert view[4:12].to_int() == 0xAB
+
+
+def test_set_int_read_only_raises():
+    view = bitview(b"\x00")
+    with pytest.raises(TypeError):
+        view.set_int(1)
+
+
+def test_slice_of_strided_view():
+    arr = bitarray("0000111111110000")
+    view = bitview(arr)[::2]
+    assert list(view[1:]) == list(arr[2::2])
+    assert list(view[1::2]) == list(arr[2::4])
+    assert list(view[::-1][1:3]) == list(arr[12:8:-2])
+
+
+def test_to_int_matches_bitarray():
+    arr = bitarray()
+    arr.frombytes(bytes(range(0, 256, 7)))
+    view = bitview(arr)
+    for start in range(0, 20):
+        for length in (1, 3, 8, 13, 64, 71):
+            bits = arr[start : start + length]
+            assert view[start : start + length].to_int() == int(bits.to01(), 2)
+            signed = int(bits.to01(), 2) - (bits[0] << length)
+            assert view[start : start + length].to_int(signed=True) == signed
+
+
+def test_to_int_little_endian_bitarray():
+    arr = bitarray("0010110011", endian="little")
+    assert bitview(arr)[1:9].to_int() == 0b10011010
+
+
+def test_to_int_little_endian():
+    view = bitview(b"\x01\x02\xff\xff")
+    assert view[:16].to_int(byteorder="little") == 0x0201
+    assert view[16:].to_int(signed=True, byteorder="little") == -1
+    arr = bitarray("1") + bitarray(buffer=b"\x01\x02")
+    assert bitview(arr)[1:].to_int(byteorder="little") == 0x0201
+    with pytest.raises(ValueError):
+        view[:12].to_int(byteorder="little")
+
+
+def test_lsb_first_bitview():
+    view = bitview(b"\x01\x80\x0f", bitorder="lsb")
+    assert view.bitorder == "lsb"
+    assert list(view[:8]) == [1, 0, 0, 0, 0, 0, 0, 0]
+    assert view[15] == 1
+    assert view[:16].to_int() == 0x8001
+    assert view[4:20].to_int() == 0xF800
+    assert view[15:17].to_int() == 0b11
+    assert view[16:20].to_int(signed=True) == -1
+
+
+def test_lsb_first_to_int_matches_bitarray():
+    data = bytes(range(0, 256, 7))
+    arr = bitarray(buffer=data, endian="little")
+    view = bitview(data, bitorder="lsb")
+    for start in range(0, 20):
+        for length in (1, 3, 8, 13, 64, 71):
+            expected = util.ba2int(arr[start : start + length])
+            assert view[start : start + length].to_int() == expected
+
+
+def test_lsb_first_set_int():
+    data = bytearray(3)
+    view = bitview(data, bitorder="lsb")
+    view[4:16].set_int(0xABC)
+    assert data == b"\xc0\xab\x00"
+    assert view[4:16].to_int() == 0xABC
+
+
+def test_copy_is_detached():
+    data = bytearray(b"\xab\xcd")
+    view = bitview(data, bitorder="lsb")[4:12]
+    copy = view.copy()
+    del view
+    data[:] = b"\x00\x00"
+    data.extend(b"\xff")
+    assert (copy.bitorder, len(copy), copy.to_int()) == ("lsb", 8, 0xDA)
+    assert bitview(b"\xf0")[::-2].copy().to_int() == 0b0011
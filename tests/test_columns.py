@@ -0,0 +1,219 @@
+from typing import Annotated
+
+import pytest
+from bitarray import bitarray
+from bitparse.bit_model import BitModel
+from bitparse.fields import u4, u7, u8, u12, u16, u32, u61, i8, i16, i32, b1, b8, f16, f32, f64
+from bitparse.fields import Array, Float, Int, UInt
+
+np = pytest.importorskip("numpy")
+
+
+class MultipleUInts(BitModel):
+    a: u8
+    b: u16
+    c: u32
+
+
+class SignedInts(BitModel):
+    small: i8
+    medium: i16
+    large: i32
+
+
+class BoolFields(BitModel):
+    flag1: b1
+    flag2: b1
+    byte_flag: b8
+
+
+class FloatFields(BitModel):
+    value32: f32
+    value64: f64
+
+
+class UnalignedFloats(BitModel):
+    flag: b1
+    value32: f32
+    _padding: u7
+    value16: f16
+
+
+class Waveform(BitModel):
+    channel: u4
+    samples: Annotated[list[int], Array(u12, 5)]
+    gains: Annotated[list[float], Array(f32, 2)]
+
+
+class MixedEndian(BitModel):
+    flag: b1
+    a: Annotated[int, UInt(16, byteorder="little")]
+    b: Annotated[int, Int(32, byteorder="little")]
+    _padding: u7
+    c: Annotated[float, Float(32, byteorder="little")]
+    d: Annotated[int, UInt(24, byteorder="little")]
+
+
+class MixedTypes(BitModel):
+    count: u8
+    enabled: b1
+    _padding: u7
+    temperature: i16
+
+
+class NonStandardBitSizes(BitModel):
+    a: u8
+    b: u12
+    c: u4
+
+
+class WideUnaligned(BitModel):
+    flag: b1
+    wide: u61
+    _padding: u4
+
+
+def test_decode_columns_struct_layout():
+    data = b"\x01\x02\x03\x04\x05\x06\x07" + b"\xaa\xbb\xcc\xdd\xee\xff\x00"
+    columns = MultipleUInts.decode_columns(data)
+    assert columns["a"].dtype == np.uint8
+    assert columns["b"].dtype == np.uint16
+    assert columns["c"].dtype == np.uint32
+    assert columns["a"].tolist() == [0x01, 0xAA]
+    assert columns["b"].tolist() == [0x0203, 0xBBCC]
+    assert columns["c"].tolist() == [0x04050607, 0xDDEEFF00]
+
+
+def test_decode_columns_signed():
+    data = b"\x80\x80\x00\x80\x00\x00\x00" + b"\x7f\x7f\xff\x7f\xff\xff\xff"
+    columns = SignedInts.decode_columns(data)
+    assert columns["small"].dtype == np.int8
+    assert columns["small"].tolist() == [-128, 127]
+    assert columns["medium"].tolist() == [-32768, 32767]
+    assert columns["large"].tolist() == [-2147483648, 2147483647]
+
+
+def test_decode_columns_floats():
+    data = FloatFields(value32=1.5, value64=-2.25).to_bytes() * 3
+    columns = FloatFields.decode_columns(data)
+    assert columns["value32"].dtype == np.float32
+    assert columns["value32"].tolist() == [1.5] * 3
+    assert columns["value64"].tolist() == [-2.25] * 3
+
+
+def test_decode_columns_unaligned_floats():
+    values = [(i % 2 == 0, i * 0.5, -i * 0.25) for i in range(5)]
+    data = b"".join(UnalignedFloats(flag=f, value32=a, value16=b).to_bytes() for f, a, b in values)
+    columns = UnalignedFloats.decode_columns(data)
+    assert columns["value16"].dtype == np.float16
+    assert columns["value32"].tolist() == [a for _, a, _ in values]
+    assert columns["value16"].tolist() == [b for _, _, b in values]
+
+
+def test_decode_columns_skips_placeholders():
+    data = MixedTypes(count=10, enabled=True, temperature=-300).to_bytes()
+    columns = MixedTypes.decode_columns(data)
+    assert list(columns) == ["count", "enabled", "temperature"]
+    assert columns["enabled"].dtype == np.bool_
+    assert columns["temperature"].tolist() == [-300]
+
+
+def test_decode_columns_bit_packed_records():
+    values = [(True, False, True), (False, True, False), (True, True, True)]
+    arr = bitarray()
+    for flag1, flag2, byte_flag in values:
+        arr.extend([flag1, flag2])
+        arr.extend(f"{int(byte_flag):08b}")
+    columns = BoolFields.decode_columns(arr.tobytes())
+    assert len(columns["flag1"]) == 3
+    assert list(zip(*(columns[name].tolist() for name in columns))) == values
+
+
+def test_decode_columns_matches_from_bytes_many():
+    data = bytes(range(256)) * 3
+    for model in (NonStandardBitSizes, MixedTypes, WideUnaligned, BoolFields):
+        columns = model.decode_columns(data)
+        records = model.from_bytes_many(data)
+        for name, column in columns.items():
+            assert column.tolist() == [getattr(record, name) for record in records]
+
+
+def test_decode_columns_empty_buffer():
+    columns = NonStandardBitSizes.decode_columns(b"")
+    assert all(len(column) == 0 for column in columns.values())
+
+
+def test_encode_columns_struct_layout():
+    data = MultipleUInts.encode_columns(a=[0x01, 0xAA], b=[0x0203, 0xBBCC], c=[0x04050607, 0])
+    assert data == b"\x01\x02\x03\x04\x05\x06\x07" + b"\xaa\xbb\xcc\x00\x00\x00\x00"
+
+
+def test_encode_columns_zero_fills_placeholders():
+    data = MixedTypes.encode_columns(count=[10, 255], enabled=[True, False], temperature=[-300, 0])
+    assert (
+        data
+        == MixedTypes(count=10, enabled=True, temperature=-300).to_bytes()
+        + MixedTypes(count=255, enabled=False, temperature=0).to_bytes()
+    )
+
+
+def test_encode_columns_roundtrip():
+    data = bytes(range(256)) * 3
+    for model in (NonStandardBitSizes, SignedInts, FloatFields, WideUnaligned, BoolFields):
+        columns = model.decode_columns(data)
+        encoded = model.encode_columns(**columns)
+        assert model.decode_columns(encoded).keys() == columns.keys()
+        for name, column in model.decode_columns(encoded).items():
+            np.testing.assert_array_equal(column, columns[name])
+
+
+def test_encode_columns_out_of_range_raises():
+    with pytest.raises(OverflowError):
+        NonStandardBitSizes.encode_columns(a=[0, 1], b=[0, 0x1000], c=[0, 0])
+    with pytest.raises(OverflowError):
+        SignedInts.encode_columns(small=[-129], medium=[0], large=[0])
+
+
+def test_encode_columns_mismatched_columns_raise():
+    with pytest.raises(ValueError):
+        NonStandardBitSizes.encode_columns(a=[0, 1], b=[0], c=[0, 0])
+    with pytest.raises(TypeError):
+        NonStandardBitSizes.encode_columns(a=[0], b=[0])
+    with pytest.raises(TypeError):
+        NonStandardBitSizes.encode_columns(a=[0], b=[0], c=[0], d=[0])
+
+
+def test_decode_columns_arrays():
+    models = [
+        Waveform(channel=i, samples=[i * 10 + j for j in range(5)], gains=[i / 2, -i])
+        for i in range(7)
+    ]
+    columns = Waveform.decode_columns(b"".join(m.to_bytes() for m in models))
+    assert columns["samples"].shape == (7, 5)
+    assert columns["samples"].tolist() == [m.samples for m in models]
+    assert columns["gains"].dtype == np.float32
+    assert columns["gains"].tolist() == [m.gains for m in models]
+
+
+def test_encode_columns_arrays():
+    samples = np.arange(15).reshape(3, 5)
+    data = Waveform.encode_columns(channel=[1, 2, 3], samples=samples, gains=np.ones((3, 2)))
+    models = Waveform.from_bytes_many(data)
+    assert [m.samples for m in models] == samples.tolist()
+    assert [m.gains for m in models] == [[1.0, 1.0]] * 3
+    with pytest.raises(ValueError):
+        Waveform.encode_columns(channel=[1], samples=np.zeros(5), gains=np.ones((1, 2)))
+
+
+def test_columns_mixed_endian():
+    models = [
+        MixedEndian(flag=i % 2 == 0, a=i * 257, b=-i * 70000, c=i / 4, d=i * 65793)
+        for i in range(6)
+    ]
+    data = b"".join(m.to_bytes() for m in models)
+    columns = MixedEndian.decode_columns(data)
+    assert columns["a"].tolist() == [m.a for m in models]
+    assert columns["b"].tolist() == [m.b for m in models]
+    assert columns["c"].tolist() == [m.c for m in models]
+    assert columns["d"].tolist() == [m.d for m in models]
+    assert MixedEndian.encode_columns(**columns) == data
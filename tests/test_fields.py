@@ -0,0 +1,62 @@
+import subprocess
+import sys
+from typing import Annotated, TypeAliasType
+
+import pytest
+from bitparse import fields
+from bitparse.fields import Bool, Int, UInt
+
+
+def run_python(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+
+def test_import_creates_no_int_aliases():
+    proc = run_python(
+        "import bitparse, bitparse.fields as f, sys\n"
+        "print(sorted(k for k in vars(f) if k[:1] in 'uib' and k[1:].isdigit()))\n"
+        "print(sorted(m for m in ('asyncio', 'concurrent.futures', 'numpy') if m in sys.modules))\n"
+    )
+    assert proc.stdout.splitlines() == ["[]", "[]"]
+
+
+@pytest.mark.parametrize(
+    "name, py_type, field",
+    [
+        ("u1", int, UInt(bits=1)),
+        ("u12", int, UInt(bits=12)),
+        ("u256", int, UInt(bits=256)),
+        ("i7", int, Int(bits=7)),
+        ("b8", bool, Bool(bits=8)),
+    ],
+)
+def test_aliases_are_created_on_demand(name, py_type, field):
+    alias = getattr(fields, name)
+    assert isinstance(alias, TypeAliasType)
+    assert alias.__name__ == name
+    assert alias.__module__ == "bitparse.fields"
+    assert alias.__value__ == Annotated[py_type, field]
+    assert getattr(fields, name) is alias
+    assert vars(fields)[name] is alias
+
+
+@pytest.mark.parametrize("name", ["u0", "u257", "u08", "x8", "u", "u1_", "i٣"])
+def test_unknown_aliases(name):
+    with pytest.raises(AttributeError):
+        getattr(fields, name)
+
+
+def test_from_import_and_dir():
+    from bitparse.fields import i100
+
+    assert i100.__value__ == Annotated[int, Int(bits=100)]
+    assert {"u1", "i256", "b99", "f16", "UInt"} <= set(dir(fields))
+
+
+def test_star_import():
+    proc = run_python(
+        "from bitparse.fields import *\n"
+        "print({'u1', 'u8', 'i256', 'b99', 'f16', 'UInt', 'VarArray'} <= set(dir()))\n"
+        "print(u8.__value__)\n"
+    )
+    assert proc.stdout.splitlines() == ["True", str(Annotated[int, UInt(bits=8)])]
@@ -0,0 +1,135 @@
+from typing import Annotated
+
+import pytest
+from bitparse import bitview
+from bitparse.bit_model import BitModel
+from bitparse.fields import u4, u8, u12, u16, VarArray
+
+
+class Tlv(BitModel):
+    tag: u8
+    length: u8
+    value: Annotated[list[int], VarArray(u8, count="length")]
+
+
+class Frame(BitModel):
+    version: u4
+    count: u4
+    items: Annotated[list[Tlv], VarArray(Tlv, count="count")]
+    crc: u16
+
+
+class Samples(BitModel):
+    n: u4
+    samples: Annotated[list[int], VarArray(u12, count="n")]
+
+
+def make_frame():
+    items = [Tlv(tag=i, length=i, value=list(range(10, 10 + i))) for i in range(4)]
+    return Frame(version=1, count=len(items), items=items, crc=0xBEEF)
+
+
+def test_var_array_roundtrip():
+    data = make_frame().to_bytes()
+    assert data == bytes.fromhex("14 0000 01010a 02020a0b 03030a0b0c beef")
+    frame = Frame.from_bytes(data)
+    assert (frame.version, frame.count, frame.crc) == (1, 4, 0xBEEF)
+    assert len(frame.items) == 4
+    assert [item.tag for item in frame.items] == [0, 1, 2, 3]
+    assert frame.items[3].value == [10, 11, 12]
+    assert frame.to_bytes() == data
+
+
+def test_var_array_decodes_items_lazily():
+    frame = Frame.from_bytes(make_frame().to_bytes())
+    assert list(frame.items._offsets) == [0, 16, 40, 72]
+    assert frame.items._cache == {}
+    item = frame.items[-2]
+    assert item.value == [10, 11]
+    assert frame.items[2] is item
+    assert list(frame.items._cache) == [2]
+
+
+def test_var_array_fixed_width_items():
+    model = Samples(n=3, samples=[1, 0xABC, 4095])
+    data = model.to_bytes()
+    assert data == b"\x30\x01\xab\xcf\xff"
+    decoded = Samples.from_bytes(data)
+    assert decoded.samples._offsets is None
+    assert decoded.samples == [1, 0xABC, 4095]
+    assert decoded.samples[1:] == [0xABC, 4095]
+
+
+def test_var_array_reencodes_changed_items():
+    data = make_frame().to_bytes()
+    frame = Frame.from_bytes(data)
+    assert frame.items[1].tag == 1
+    assert frame.to_bytes() == data
+    frame.items[1].tag = 7
+    frame.items[3].value = [0xFF, 11, 12]
+    assert frame.to_bytes() == bytes.fromhex("14 0000 07010a 02020a0b 0303ff0b0c beef")
+    samples = Samples.from_bytes(b"\x30\x01\xab\xcf\xff")
+    assert samples.samples[1] == 0xABC
+    assert samples.samples.pristine
+
+
+def test_var_array_truncated_records():
+    class Tail(BitModel):
+        n: u8
+        items: Annotated[list[int], VarArray(u8, count="n")]
+        tail: u16
+
+    full = Tail(n=2, items=[1, 2], tail=0x1234).to_bytes()
+    for size in range(len(full)):
+        with pytest.raises(ValueError):
+            Tail.from_bytes(full[:size])
+    for size in range(len(full)):
+        assert [r.tail for r in Tail.from_bytes_many(full + full[:size])] == [0x1234]
+
+
+def test_var_array_detached_from_source():
+    buf = bytearray(b"\x20\x05\x06\x00")
+    decoded = Samples.from_bytes(buf)
+    buf[1] = 0x99
+    buf.extend(b"\xff" * 100)
+    assert list(decoded.samples) == [0x005, 0x060]
+    assert decoded.to_bytes() == b"\x20\x05\x06\x00"
+
+
+def test_var_array_measure():
+    data = make_frame().to_bytes()
+    assert Frame._measure(bitview(data + b"\xff")) == len(data) * 8
+
+
+def test_var_array_count_mismatch():
+    with pytest.raises(ValueError):
+        Samples(n=2, samples=[1, 2, 3]).to_bytes()
+
+
+def test_var_array_short_buffer():
+    with pytest.raises(ValueError):
+        Samples.from_bytes(b"\x40\x01")
+
+
+def test_var_array_placeholder():
+    class Skipped(BitModel):
+        n: u4
+        _samples: Annotated[list[int], VarArray(u12, count="n")]
+        crc: u16
+
+    decoded = Skipped.from_bytes(b"\x20\x05\x06\x0b\xee\xf0")
+    assert (decoded.n, decoded.crc) == (2, 0xBEEF)
+    assert decoded.to_bytes() == b"\x20\x00\x00\x0b\xee\xf0"
+    with pytest.raises(TypeError):
+
+        class VariableItems(BitModel):
+            n: u4
+            _items: Annotated[list[Tlv], VarArray(Tlv, count="n")]
+
+
+def test_var_array_count_must_come_first():
+    with pytest.raises(TypeError):
+
+        class Backwards(BitModel):
+            items: Annotated[list[int], VarArray(u8, count="n")]
+            n: u8
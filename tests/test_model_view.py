@@ -0,0 +1,109 @@
+import pytest
+from bitarray import bitarray
+from bitparse import bitview
+from bitparse.bit_model import BitModel
+from bitparse.fields import u4, u7, u8, u12, i16, b1
+
+
+class MixedTypes(BitModel):
+    count: u8
+    enabled: b1
+    _padding: u7
+    _padding2: u8
+    temperature: i16
+
+
+class NonStandardBitSizes(BitModel):
+    a: u8
+    b: u12
+    c: u4
+
+
+def test_view_reads_fields():
+    view = MixedTypes.view(b"\x0a\x80\x00\xfe\xd4")
+    assert view.count == 10
+    assert view.enabled
+    assert view.temperature == -300
+
+
+def test_view_decodes_lazily():
+    view = MixedTypes.view(b"\x0a\x80\x00\xfe\xd4")
+    assert "temperature" not in vars(view)
+    assert view.temperature == -300
+    assert "temperature" in vars(view)
+    assert "count" not in vars(view)
+
+
+def test_view_unaligned_fields():
+    view = NonStandardBitSizes.view(b"\xab\xcd\x0e")
+    assert view.a == 0xAB
+    assert view.b == 0xCD0
+    assert view.c == 0xE
+
+
+def test_view_from_unaligned_bitview():
+    arr = bitarray("101")
+    arr.frombytes(b"\xab\xcd\x0e")
+    view = NonStandardBitSizes.view(bitview(arr)[3:])
+    assert (view.a, view.b, view.c) == (0xAB, 0xCD0, 0xE)
+
+
+def test_view_placeholder_and_unknown_raise():
+    view = MixedTypes.view(b"\x0a\x80\x00\xfe\xd4")
+    with pytest.raises(AttributeError):
+        _ = view._padding
+    with pytest.raises(AttributeError):
+        _ = view.missing
+
+
+def test_view_to_model_and_bytes():
+    data = b"\x0a\x80\x00\xfe\xd4"
+    view = MixedTypes.view(data + b"\xff")
+    model = view.to_model()
+    assert (model.count, model.enabled, model.temperature) == (10, True, -300)
+    assert bytes(view) == data
+
+
+def test_view_short_buffer_raises():
+    with pytest.raises(ValueError):
+        MixedTypes.view(b"\x0a\x80")
+
+
+def test_view_assignment_writes_buffer():
+    data = bytearray(b"\x0a\x80\x00\xfe\xd4\xff")
+    view = MixedTypes.view(data)
+    view.temperature = 1234
+    view.enabled = False
+    assert data == bytearray(b"\x0a\x00\x00\x04\xd2\xff")
+    assert view.temperature == 1234
+    assert MixedTypes.from_bytes(data).temperature == 1234
+
+
+def test_view_assignment_unaligned_field():
+    data = bytearray(b"\xab\xcd\x0e")
+    view = NonStandardBitSizes.view(data)
+    view.b = 0x123
+    assert data == bytearray(b"\xab\x12\x3e")
+
+
+def test_view_assignment_in_bitview_window():
+    data = bytearray(b"\x00" + b"\xab\xcd\x0e")
+    view = NonStandardBitSizes.view(bitview(data)[8:])
+    view.c = 0x5
+    assert data == bytearray(b"\x00\xab\xcd\x05")
+
+
+def test_view_assignment_out_of_range_raises():
+    data = bytearray(b"\xab\xcd\x0e")
+    view = NonStandardBitSizes.view(data)
+    with pytest.raises(OverflowError):
+        view.b = 0x1000
+    assert data == bytearray(b"\xab\xcd\x0e")
+
+
+def test_view_assignment_read_only_buffer_raises():
+    view = NonStandardBitSizes.view(b"\xab\xcd\x0e")
+    with pytest.raises(TypeError):
+        view.a = 1
+    with pytest.raises(AttributeError):
+        MixedTypes.view(bytearray(5))._padding = 1
@@ -0,0 +1,53 @@
+import pytest
+from bitparse.bit_model import BitModel
+from bitparse.fields import u3, u8, u12, u16, u32, b1
+
+from .test_record_file import write_records
+
+
+class MultipleUInts(BitModel):
+    a: u8
+    b: u16
+    c: u32
+
+
+class Unaligned(BitModel):
+    seq: u12
+    flag: b1
+
+
+class Tiny(BitModel):
+    a: u3
+
+
+@pytest.fixture
+def unaligned_file(tmp_path):
+    path = tmp_path / "unaligned.bin"
+    write_records(path, [Unaligned(seq=i * 7, flag=i % 2 == 0) for i in range(100)])
+    return path
+
+
+def test_decode_file_parallel(unaligned_file):
+    models = Unaligned.decode_file_parallel(unaligned_file, workers=3, shard_size=10)
+    assert [m.seq for m in models] == [i * 7 for i in range(100)]
+    assert [m.flag for m in models] == [i % 2 == 0 for i in range(100)]
+
+
+def test_decode_file_parallel_single_worker(unaligned_file):
+    models = Unaligned.decode_file_parallel(unaligned_file, workers=1, shard_size=7)
+    assert [m.seq for m in models] == [i * 7 for i in range(100)]
+
+
+def test_decode_file_parallel_columns(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "tiny.bin"
+    write_records(path, [Tiny(a=i % 8) for i in range(101)])
+    columns = Tiny.decode_file_parallel(path, workers=2, columns=True, shard_size=16)
+    np.testing.assert_array_equal(columns["a"], [i % 8 for i in range(len(columns["a"]))])
+    assert len(columns["a"]) == len(Tiny.open_file(path))
+
+
+def test_decode_file_parallel_empty(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert MultipleUInts.decode_file_parallel(path, workers=2) == []
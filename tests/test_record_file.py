@@ -0,0 +1,89 @@
+import bisect
+
+import pytest
+from bitparse.bit_model import BitModel
+from bitparse.fields import u8, u12, u16, u32, b1, b8
+
+
+class MultipleUInts(BitModel):
+    a: u8
+    b: u16
+    c: u32
+
+
+class BoolFields(BitModel):
+    flag1: b1
+    flag2: b1
+    byte_flag: b8
+
+
+class Unaligned(BitModel):
+    seq: u12
+    flag: b1
+
+
+def write_records(path, models):
+    bits = "".join(
+        f"{int.from_bytes(m.to_bytes()) >> (-m.bit_size % 8):0{m.bit_size}b}" for m in models
+    )
+    bits += "0" * (-len(bits) % 8)
+    path.write_bytes(int(bits, 2).to_bytes(len(bits) // 8) if bits else b"")
+
+
+@pytest.fixture
+def unaligned_file(tmp_path):
+    path = tmp_path / "unaligned.bin"
+    write_records(path, [Unaligned(seq=i * 7, flag=i % 2 == 0) for i in range(50)])
+    return path
+
+
+def test_iter_file(tmp_path):
+    path = tmp_path / "records.bin"
+    write_records(path, [MultipleUInts(a=i, b=i * 2, c=i * 3) for i in range(10)])
+    models = list(MultipleUInts.iter_file(path))
+    assert [(m.a, m.b, m.c) for m in models] == [(i, i * 2, i * 3) for i in range(10)]
+
+
+def test_iter_file_start_stop(unaligned_file):
+    models = list(Unaligned.iter_file(unaligned_file, start=11, stop=17))
+    assert [m.seq for m in models] == [i * 7 for i in range(11, 17)]
+    assert [m.flag for m in models] == [i % 2 == 0 for i in range(11, 17)]
+
+
+def test_iter_file_batches(unaligned_file):
+    batches = list(Unaligned.iter_file(unaligned_file, start=3, batch_size=20))
+    assert [len(batch) for batch in batches] == [20, 20, 7]
+    assert [m.seq for batch in batches for m in batch] == [i * 7 for i in range(3, 50)]
+
+
+def test_iter_file_empty(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert list(BoolFields.iter_file(path)) == []
+
+
+def test_open_file_random_access(unaligned_file):
+    with Unaligned.open_file(unaligned_file) as records:
+        assert len(records) == 50
+        assert records[0].seq == 0
+        assert records[33].seq == 33 * 7
+        assert records[-1].seq == 49 * 7
+        assert [m.seq for m in records[5:8]] == [35, 42, 49]
+        assert [m.seq for m in records[40::4]] == [280, 308, 336]
+        with pytest.raises(IndexError):
+            _ = records[50]
+
+
+def test_open_file_bisect(unaligned_file):
+    with Unaligned.open_file(unaligned_file) as records:
+        assert bisect.bisect_left(records, 100, key=lambda m: m.seq) == 15
+
+
+def test_open_file_writable_view(tmp_path):
+    path = tmp_path / "records.bin"
+    write_records(path, [MultipleUInts(a=i, b=i * 2, c=i * 3) for i in range(10)])
+    with MultipleUInts.open_file(path, writable=True) as records:
+        view = records.view(4)
+        view.c = 0xDEADBEEF
+        del view
+    assert MultipleUInts.from_bytes_many(path.read_bytes())[4].c == 0xDEADBEEF
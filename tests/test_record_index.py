@@ -0,0 +1,167 @@
+import bisect
+from typing import Annotated
+
+import pytest
+from bitparse import TaggedUnion
+from bitparse.bit_model import BitModel
+from bitparse.fields import u4, u8, u12, u16, u32, VarArray
+from bitparse.record_index import build_index, IndexedRecordFile
+
+
+class Packet(BitModel):
+    timestamp: u32
+    length: u8
+    payload: Annotated[list[int], VarArray(u8, count="length")]
+
+
+class Nibbles(BitModel):
+    count: u4
+    values: Annotated[list[int], VarArray(u4, count="count")]
+
+
+class Heartbeat(BitModel):
+    kind: u8
+    seq: u16
+
+
+class Chunk(BitModel):
+    kind: u8
+    length: u8
+    data: Annotated[list[int], VarArray(u8, count="length")]
+
+
+def make_packets(n):
+    return [Packet(timestamp=10 * i, length=i % 5, payload=list(range(i % 5))) for i in range(n)]
+
+
+def write_packets(path, packets):
+    path.write_bytes(b"".join(p.to_bytes() for p in packets))
+
+
+def values(record):
+    return type(record), {name: getattr(record, name) for name in record.fields}
+
+
+def test_random_access(tmp_path):
+    path = tmp_path / "capture.bin"
+    packets = make_packets(100)
+    write_packets(path, packets)
+    with Packet.open_indexed(path) as records:
+        assert (tmp_path / "capture.bin.idx").exists()
+        assert len(records) == 100
+        assert values(records[37]) == values(packets[37])
+        assert values(records[-1]) == values(packets[-1])
+        assert [r.timestamp for r in records[10:13]] == [100, 110, 120]
+        assert records.bit_range(1) == (40, 40 + 40 + 8)
+        with pytest.raises(IndexError):
+            records[100]
+
+
+def test_bisect_on_timestamp(tmp_path):
+    path = tmp_path / "capture.bin"
+    write_packets(path, make_packets(100))
+    with Packet.open_indexed(path) as records:
+        lo = bisect.bisect_left(records, 250, key=lambda r: r.timestamp)
+        hi = bisect.bisect_right(records, 300, key=lambda r: r.timestamp)
+        assert [r.timestamp for r in records[lo:hi]] == [250, 260, 270, 280, 290, 300]
+
+
+def test_index_is_reused_and_extended(tmp_path):
+    path = tmp_path / "capture.bin"
+    packets = make_packets(20)
+    data = b"".join(p.to_bytes() for p in packets)
+    # The last record is still being written.
+    path.write_bytes(data[:-2])
+    with IndexedRecordFile(Packet, path) as records:
+        assert len(records) == 19
+    index = (tmp_path / "capture.bin.idx").read_bytes()
+    assert build_index(Packet, path) == str(tmp_path / "capture.bin.idx")
+    assert (tmp_path / "capture.bin.idx").read_bytes() == index
+
+    more = make_packets(30)[20:]
+    path.write_bytes(data + b"".join(p.to_bytes() for p in more))
+    with IndexedRecordFile(Packet, path) as records:
+        assert len(records) == 30
+        assert [values(r) for r in records] == [values(p) for p in packets + more]
+
+    # A capture that shrank was replaced, its index is rebuilt.
+    write_packets(path, packets[:3])
+    with IndexedRecordFile(Packet, path) as records:
+        assert len(records) == 3
+
+
+def test_rewritten_capture_is_reindexed(tmp_path):
+    path = tmp_path / "capture.bin"
+    write_packets(path, make_packets(20))
+    with IndexedRecordFile(Packet, path) as records:
+        assert len(records) == 20
+    # Same size and then larger, but with other records, the old offsets don't apply.
+    packets = [Packet(timestamp=i, length=4 - i % 5, payload=[7] * (4 - i % 5)) for i in range(20)]
+    write_packets(path, packets)
+    assert path.stat().st_size == sum(len(p.to_bytes()) for p in make_packets(20))
+    with IndexedRecordFile(Packet, path) as records:
+        assert [values(r) for r in records] == [values(p) for p in packets]
+    packets = make_packets(25)[::-1]
+    write_packets(path, packets)
+    with IndexedRecordFile(Packet, path) as records:
+        assert [values(r) for r in records] == [values(p) for p in packets]
+
+
+def test_unaligned_records(tmp_path):
+    path = tmp_path / "nibbles.bin"
+    records = [Nibbles(count=i % 4, values=[i % 16] * (i % 4)) for i in range(28)]
+    bits = "".join(r._to_bits().to01() for r in records)
+    assert len(bits) % 8 == 0
+    path.write_bytes(int(bits, 2).to_bytes(len(bits) // 8))
+    with Nibbles.open_indexed(path, tmp_path / "custom.idx") as indexed:
+        assert (tmp_path / "custom.idx").exists()
+        assert len(indexed) == 28
+        assert [values(r) for r in indexed] == [values(r) for r in records]
+
+
+def test_trailing_padding_is_not_a_record(tmp_path):
+    class Wide(BitModel):
+        n: u4
+        values: Annotated[list[int], VarArray(u12, count="n")]
+
+    path = tmp_path / "wide.bin"
+    records = [Wide(n=n, values=[0xABC] * n) for n in (2, 1, 1, 1, 1)]
+    bits = "".join(r._to_bits().to01() for r in records)
+    assert len(bits) % 8 == 4
+    bits += "0000"
+    path.write_bytes(int(bits, 2).to_bytes(len(bits) // 8))
+    with Wide.open_indexed(path) as indexed:
+        assert len(indexed) == 5
+        assert [values(r) for r in indexed] == [values(r) for r in records]
+
+
+def test_close_with_records_alive(tmp_path):
+    path = tmp_path / "nibbles.bin"
+    records = [Nibbles(count=c, values=list(range(c))) for c in (1, 0, 2)]
+    bits = "".join(r._to_bits().to01() for r in records)
+    path.write_bytes(int(bits, 2).to_bytes(len(bits) // 8))
+    indexed = Nibbles.open_indexed(path)
+    kept = list(indexed)
+    indexed.close()
+    assert [r.values for r in kept] == [[0], [], [0, 1]]
+
+
+def test_tagged_union_capture(tmp_path):
+    union = TaggedUnion("kind", {1: Heartbeat, 2: Chunk})
+    records = [
+        Heartbeat(kind=1, seq=i) if i % 3 else Chunk(kind=2, length=i % 4, data=[i] * (i % 4))
+        for i in range(30)
+    ]
+    path = tmp_path / "mixed.bin"
+    path.write_bytes(b"".join(r.to_bytes() for r in records))
+    with union.open_indexed(path) as indexed:
+        assert len(indexed) == 30
+        assert [values(r) for r in indexed] == [values(r) for r in records]
+
+
+def test_empty_capture(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    with Packet.open_indexed(path) as records:
+        assert len(records) == 0
+        assert list(records) == []
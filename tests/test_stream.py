@@ -0,0 +1,146 @@
+import asyncio
+from typing import Annotated
+
+import pytest
+
+from bitparse.bit_model import BitModel
+from bitparse.fields import u8, u12, u16, u32, b1, VarArray
+
+
+class MultipleUInts(BitModel):
+    a: u8
+    b: u16
+    c: u32
+
+
+class Unaligned(BitModel):
+    seq: u12
+    flag: b1
+
+
+def unaligned_bytes(count):
+    bits = "".join(f"{i * 7:012b}{i % 2}" for i in range(count))
+    bits += "0" * (-len(bits) % 8)
+    return int(bits, 2).to_bytes(len(bits) // 8)
+
+
+def test_feed_whole_records():
+    decoder = MultipleUInts.decoder()
+    models = decoder.feed(b"\x01\x02\x03\x04\x05\x06\x07" * 2)
+    assert [(m.a, m.b, m.c) for m in models] == [(0x01, 0x0203, 0x04050607)] * 2
+    assert decoder.pending_bits == 0
+
+
+def test_feed_split_records():
+    decoder = MultipleUInts.decoder()
+    assert decoder.feed(b"\x01\x02\x03") == []
+    assert decoder.pending_bits == 24
+    models = decoder.feed(b"\x04\x05\x06\x07\xaa")
+    assert [(m.a, m.b, m.c) for m in models] == [(0x01, 0x0203, 0x04050607)]
+    assert decoder.pending_bits == 8
+    assert decoder.feed(b"") == []
+    models = decoder.feed(b"\xbb\xcc\xdd\xee\xff\x00")
+    assert [(m.a, m.b, m.c) for m in models] == [(0xAA, 0xBBCC, 0xDDEEFF00)]
+
+
+def test_feed_unaligned_records_byte_by_byte():
+    data = unaligned_bytes(40)
+    decoder = Unaligned.decoder()
+    models = []
+    for i in range(len(data)):
+        models.extend(decoder.feed(data[i : i + 1]))
+    assert [m.seq for m in models] == [i * 7 for i in range(40)]
+    assert [m.flag for m in models] == [i % 2 == 1 for i in range(40)]
+    assert decoder.pending_bits == len(data) * 8 - 40 * 13
+
+
+def test_decode_chunks():
+    data = unaligned_bytes(25)
+    chunks = [data[i : i + 5] for i in range(0, len(data), 5)]
+    models = list(Unaligned.decoder().decode(chunks))
+    assert [m.seq for m in models] == [i * 7 for i in range(25)]
+
+
+def test_feed_padded_records():
+    models = [Unaligned(seq=i, flag=i % 2 == 1) for i in range(5)]
+    data = b"".join(m.to_bytes() for m in models)
+    decoder = Unaligned.decoder(padded=True)
+    assert decoder.feed(data[:1]) == []
+    decoded = decoder.feed(data[1:])
+    assert [(m.seq, m.flag) for m in decoded] == [(m.seq, m.flag) for m in models]
+    assert decoder.pending_bits == 0
+
+
+def reader_for(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def test_read_from():
+    async def read():
+        reader = reader_for(b"\x01\x02\x03\x04\x05\x06\x07\xaa")
+        model = await MultipleUInts.read_from(reader)
+        with pytest.raises(asyncio.IncompleteReadError):
+            await MultipleUInts.read_from(reader)
+        return model
+
+    model = asyncio.run(read())
+    assert (model.a, model.b, model.c) == (0x01, 0x0203, 0x04050607)
+
+
+def test_read_from_variable_width_model():
+    class Variable(BitModel):
+        n: u8
+        items: Annotated[list[int], VarArray(u8, count="n")]
+
+    async def read():
+        return await Variable.read_from(reader_for(b"\x01\x02"))
+
+    with pytest.raises(TypeError, match="Variable does not have a fixed-width layout"):
+        asyncio.run(read())
+
+
+def test_stream():
+    models = [Unaligned(seq=i * 7, flag=i % 2 == 1) for i in range(30)]
+    data = b"".join(m.to_bytes() for m in models)
+
+    async def collect():
+        return [m async for m in Unaligned.stream(reader_for(data), chunk_size=5)]
+
+    decoded = asyncio.run(collect())
+    assert [(m.seq, m.flag) for m in decoded] == [(m.seq, m.flag) for m in models]
+
+
+def test_stream_truncated():
+    async def collect():
+        return [m async for m in MultipleUInts.stream(reader_for(b"\x00" * 10))]
+
+    with pytest.raises(asyncio.IncompleteReadError):
+        asyncio.run(collect())
+
+
+def test_write_to_round_trip():
+    models = [MultipleUInts(a=i, b=i * 300, c=i * 70000) for i in range(10)]
+
+    async def round_trip():
+        decoded = []
+
+        async def handle(reader, writer):
+            decoded.extend([m async for m in MultipleUInts.stream(reader)])
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        _, writer = await asyncio.open_connection("127.0.0.1", port)
+        for model in models:
+            await model.write_to(writer)
+        writer.close()
+        await writer.wait_closed()
+        server.close()
+        await server.wait_closed()
+        return decoded
+
+    decoded = asyncio.run(round_trip())
+    assert [(m.a, m.b, m.c) for m in decoded] == [(m.a, m.b, m.c) for m in models]
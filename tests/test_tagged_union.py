@@ -0,0 +1,128 @@
+from typing import Annotated
+
+import pytest
+from bitparse import bitview, TaggedUnion
+from bitparse.bit_model import BitModel
+from bitparse.fields import u4, u8, u12, u16, i8, Int, VarArray
+
+
+class Ping(BitModel):
+    kind: u8
+    seq: u16
+
+
+class Pong(BitModel):
+    kind: u8
+    seq: u16
+    latency: u16
+
+
+class Data(BitModel):
+    kind: u8
+    length: u8
+    payload: Annotated[list[int], VarArray(u8, count="length")]
+
+
+messages = TaggedUnion("kind", {1: Ping, 2: Pong, 3: Data})
+
+
+class Short(BitModel):
+    version: u4
+    kind: i8
+    value: u4
+
+
+class Long(BitModel):
+    version: u4
+    kind: i8
+    value: u12
+
+
+nibbles = TaggedUnion("kind", {-1: Short, 5: Long})
+
+
+def make_model(name, **annotations):
+    return type(BitModel)(name, (BitModel,), {"__annotations__": annotations})
+
+
+def values(record):
+    return type(record), {name: getattr(record, name) for name in record.fields}
+
+
+def test_decode_dispatches_on_tag():
+    assert values(messages.decode(b"\x01\x00\x07")) == values(Ping(kind=1, seq=7))
+    pong = messages.decode(bytearray(b"\x02\x00\x07\x01\x00"))
+    assert values(pong) == values(Pong(kind=2, seq=7, latency=256))
+    data = messages.decode(memoryview(b"\x03\x02\xaa\xbb"))
+    assert values(data) == values(Data(kind=3, length=2, payload=[0xAA, 0xBB]))
+    assert values(messages.decode(bitview(b"\x01\x00\x07"))) == values(Ping(kind=1, seq=7))
+    assert messages.model_for(b"\x02") is Pong
+
+
+def test_unknown_tag():
+    with pytest.raises(ValueError, match="kind=9"):
+        messages.decode(b"\x09\x00\x00")
+    with pytest.raises(ValueError):
+        messages.decode(b"")
+
+
+def test_iter_from_bytes_mixed_records():
+    records = [
+        Ping(kind=1, seq=1),
+        Data(kind=3, length=1, payload=[5]),
+        Pong(kind=2, seq=2, latency=3),
+    ]
+    data = b"".join(r.to_bytes() for r in records)
+    assert list(map(values, messages.from_bytes_many(data))) == list(map(values, records))
+
+
+def test_unaligned_signed_tag():
+    records = [Short(version=1, kind=-1, value=2), Long(version=3, kind=5, value=0xABC)]
+    data = b"".join(r.to_bytes() for r in records)
+    assert values(nibbles.decode(data)) == values(records[0])
+    assert list(map(values, nibbles.from_bytes_many(data))) == list(map(values, records))
+    assert nibbles.model_for(bitview(data)[16:]) is Long
+
+
+def test_iter_from_bytes_ignores_trailing_partial_record():
+    for tag in (u8, u4):
+        one = make_model("One", k=tag, v=u4)
+        two = make_model("Two", k=tag)
+        union = TaggedUnion("k", {1: one, 2: two})
+        packed = one(k=1, v=5)._to_bits() + two(k=2)._to_bits()
+        assert len(packed) % 8
+        records = union.from_bytes_many(packed.tobytes())
+        assert [(type(r), r.k) for r in records] == [(one, 1), (two, 2)]
+
+    data = Data(kind=3, length=2, payload=[1, 2]).to_bytes()
+    for size in range(len(data)):
+        assert len(messages.from_bytes_many(data + data[:size])) == 1
+    with pytest.raises(ValueError, match="kind=9"):
+        messages.from_bytes_many(data + b"\x09\x00\x00")
+
+
+def test_wide_tags_use_a_dict():
+    class A(BitModel):
+        kind: Annotated[int, Int(bits=32)]
+
+    union = TaggedUnion("kind", {-(2**31): A})
+    assert isinstance(union._table, dict)
+    assert union.decode(b"\x80\x00\x00\x00").kind == -(2**31)
+
+
+def test_tag_layout_must_match():
+    class Other(BitModel):
+        seq: u16
+        kind: u8
+
+    class Wider(BitModel):
+        kind: u16
+
+    with pytest.raises(TypeError):
+        TaggedUnion("kind", {1: Ping, 2: Other})
+    with pytest.raises(TypeError):
+        TaggedUnion("kind", {1: Ping, 2: Wider})
+    with pytest.raises(TypeError):
+        TaggedUnion("seq", {1: Ping, 2: Data})
+    with pytest.raises(TypeError):
+        TaggedUnion("payload", {1: Data})